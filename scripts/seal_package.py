@@ -3,23 +3,30 @@
 Seal packaging utility
 
 Subcommands:
-  - package: Create dist/sealed-meta.tgz from dist.whitelist.txt (after make seal)
+  - package: Create dist/sealed-meta.tgz from dist.whitelist.txt (after make seal);
+             --format zst writes dist/sealed-meta.tar.zst instead; skipped when
+             the <archive>.manifest.json sidecar shows no content change
   - verify:  Verify expected files exist inside dist/sealed-meta.tgz
   - list:    List first N entries in the archive (default 60)
   - version: Print repo version and expected tag
 
 This script intentionally avoids external deps and uses Python stdlib only.
+The optional zstd format uses stdlib tarfile on Python 3.14+ and otherwise
+needs the ``zstandard`` package.
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
 import glob
+import gzip
+import hashlib
+import itertools
+import json
 import os
-import shutil
 import sys
 import tarfile
-import tempfile
 from pathlib import PurePosixPath
 
 
@@ -34,7 +41,153 @@ def read_version(pyproject_path: str = "pyproject.toml") -> str | None:
         return None
 
 
-def package(whitelist_path: str, out_path: str) -> None:
+_ZST_SUFFIXES = (".zst", ".tzst")
+
+
+def _archive_format(path: str) -> str:
+    return "zst" if path.endswith(_ZST_SUFFIXES) else "gz"
+
+
+@contextlib.contextmanager
+def _open_tar(path: str, mode: str, fmt: str | None = None, stream: bool = False):
+    """Open a tar archive for reading ("r") or writing ("w").
+
+    ``fmt`` is "gz" or "zst"; when omitted it is inferred from the file suffix.
+    ``stream`` opens a forward-only stream (``r|gz``) that never builds the
+    member index.
+    """
+    fmt = fmt or _archive_format(path)
+    if fmt == "gz" and mode == "w" and not stream:
+        # tarfile's w:gz stamps the current time into the gzip header; pin it
+        # (and leave out the file name) so the header never varies.
+        with (
+            open(path, "wb") as fp,
+            gzip.GzipFile(filename="", mode="wb", fileobj=fp, mtime=0) as gz,
+            tarfile.open(fileobj=gz, mode="w") as tf,
+        ):
+            yield tf
+        return
+    if fmt == "gz" or sys.version_info >= (3, 14):
+        with tarfile.open(path, f"{mode}{'|' if stream else ':'}{fmt}") as tf:
+            yield tf
+        return
+    try:
+        import zstandard  # type: ignore[import]
+    except ImportError:
+        print(
+            "error: zstd archives need Python 3.14+ or the 'zstandard' package",
+            file=sys.stderr,
+        )
+        sys.exit(2)
+    with open(path, f"{mode}b") as fp:
+        if mode == "r":
+            zfp = zstandard.ZstdDecompressor().stream_reader(fp)
+        else:
+            zfp = zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(fp)
+        with zfp, tarfile.open(fileobj=zfp, mode=f"{mode}|") as tf:
+            yield tf
+
+
+def _reproducible(info: tarfile.TarInfo) -> tarfile.TarInfo:
+    """Honour ``SOURCE_DATE_EPOCH`` (reproducible-builds.org) when it is set.
+
+    Member mtimes are clamped to the epoch and ownership is normalized, so the
+    same tree and epoch give byte-identical gz archives. Without it, members
+    keep their real metadata.
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch:
+        info.mtime = min(info.mtime, int(epoch))
+        info.uid = info.gid = 0
+        info.uname = info.gname = ""
+    return info
+
+
+def _iter_tree(path: str):
+    """Yield ``path`` and, for directories, everything beneath it in sorted order."""
+    yield path
+    if not os.path.isdir(path):
+        return
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in dirs + sorted(files):
+            yield os.path.join(root, name)
+
+
+def _match_whitelist(lines: list[str]) -> list[list[str]]:
+    """Expand each whitelist line with ``glob`` (``**`` recursive), sorted for a stable archive order."""
+    return [sorted(glob.iglob(line, recursive=True)) for line in lines]
+
+
+def _manifest_path(out_path: str) -> str:
+    """Sidecar named after the archive, e.g. dist/sealed-meta.tgz.manifest.json.
+
+    Each archive (and so each format) gets its own sidecar, so building one
+    format never invalidates the other.
+    """
+    return out_path + ".manifest.json"
+
+
+def _load_manifest(path: str) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _build_manifest(members: list[str], fmt: str, prior: dict) -> dict:
+    """Map each member to [mtime_ns, size, sha256_12] ([] for directories).
+
+    Digests are reused from ``prior`` when mtime and size are unchanged, so
+    only touched files are re-read.
+    """
+    prior_entries = prior.get("entries", {})
+    entries: dict[str, list] = {}
+    for member in members:
+        if os.path.isdir(member):
+            entries[member] = []
+            continue
+        st = os.stat(member)
+        old = prior_entries.get(member)
+        if old and old[:2] == [st.st_mtime_ns, st.st_size]:
+            digest = old[2]
+        else:
+            with open(member, "rb") as f:
+                digest = hashlib.file_digest(f, "sha256").hexdigest()[:12]
+        entries[member] = [st.st_mtime_ns, st.st_size, digest]
+    return {"format": fmt, "entries": entries}
+
+
+def _content_key(manifest: dict) -> tuple:
+    """Manifest identity ignoring mtimes: `make seal` rewrites every file without changing its content."""
+    entries = manifest.get("entries", {})
+    return manifest.get("format"), [(path, entry[1:]) for path, entry in entries.items()]
+
+
+def _collect_members(lines: list[str], matches: list[list[str]]) -> tuple[list[str], int]:
+    """Flatten whitelist matches into archive members (each path once) and count included entries."""
+    members: list[str] = []
+    added: set[str] = set()
+    included = 0
+    for line, matched in zip(lines, matches, strict=True):
+        if not matched:
+            # It's okay to have a non-matching pattern, but log it for visibility
+            print(f"warn: pattern matched no files: {line}")
+            continue
+        for path in matched:
+            if not os.path.exists(path):
+                continue
+            # `**` matches a directory and its contents; add each path once.
+            for member in _iter_tree(path):
+                if member not in added:
+                    added.add(member)
+                    members.append(member)
+            included += 1
+    return members, included
+
+
+def package(whitelist_path: str, out_path: str, fmt: str = "gz", force: bool = False) -> None:
     if not os.path.exists(whitelist_path):
         print(
             f"error: whitelist file not found: {whitelist_path}",
@@ -42,45 +195,36 @@ def package(whitelist_path: str, out_path: str) -> None:
         )
         sys.exit(2)
 
-    # Stage files into a temp directory based on whitelist
-    stage = tempfile.mkdtemp(prefix="seal_pkg_")
-    included = 0
     with open(whitelist_path, encoding="utf-8") as f:
-        for raw in f:
-            line = raw.strip()
-            if not line or line.startswith("#"):
-                continue
-            # Support recursive globs like **
-            matched = glob.glob(line, recursive=True)
-            if not matched:
-                # It's okay to have a non-matching pattern, but log it for visibility
-                print(f"warn: pattern matched no files: {line}")
-                continue
-            for path in matched:
-                if not os.path.exists(path):
-                    continue
-                dest = os.path.join(stage, path)
-                os.makedirs(os.path.dirname(dest), exist_ok=True)
-                if os.path.isdir(path):
-                    shutil.copytree(path, dest, dirs_exist_ok=True)
-                else:
-                    shutil.copy2(path, dest)
-                included += 1
+        lines = [line for line in (raw.strip() for raw in f) if line and not line.startswith("#")]
+    # Support recursive globs like **
+    matches = _match_whitelist(lines)
+
+    members, included = _collect_members(lines, matches)
+
+    # Skip recompression entirely when the previous archive has the same content.
+    manifest_path = _manifest_path(out_path)
+    prior = _load_manifest(manifest_path)
+    manifest = _build_manifest(members, fmt, prior)
+    if not force and os.path.exists(out_path) and _content_key(manifest) == _content_key(prior):
+        print(f"unchanged: {out_path} ({included} entries)")
+        return
 
+    # Add whitelisted files straight into the archive; no staging copy.
     os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
-    with tarfile.open(out_path, "w:gz") as tf:
-        tf.add(stage, arcname=".")
+    with _open_tar(out_path, "w", fmt) as tf:
+        for member in members:
+            tf.add(member, arcname=member, recursive=False, filter=_reproducible)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
 
-    print(f"created: {out_path} (staged {included} entries)")
+    print(f"created: {out_path} (added {included} entries)")
 
 
 def verify(archive_path: str, extra_expected: list[str] | None = None) -> None:
     if not os.path.exists(archive_path):
         print(f"error: archive not found: {archive_path}", file=sys.stderr)
         sys.exit(2)
-    with tarfile.open(archive_path, "r:gz") as tf:
-        names = {str(PurePosixPath(m.name).as_posix().lstrip("./")) for m in tf.getmembers()}
-
     # Minimal expectations: top-level legal docs and at least one sealed source
     expected = [
         "LICENSE",
@@ -90,12 +234,18 @@ def verify(archive_path: str, extra_expected: list[str] | None = None) -> None:
     ]
     if extra_expected:
         expected.extend(extra_expected)
-    ok = True
+
+    # Tick expected names off while streaming members; stop once all are seen.
+    missing = set(expected)
+    with _open_tar(archive_path, "r") as tf:
+        for m in tf:
+            missing.discard(str(PurePosixPath(m.name).as_posix().lstrip("./")))
+            if not missing:
+                break
+
     for e in expected:
-        present = e in names
-        print(("FOUND: " if present else "MISSING: ") + e)
-        ok = ok and present
-    if not ok:
+        print(("MISSING: " if e in missing else "FOUND: ") + e)
+    if missing:
         sys.exit(1)
 
 
@@ -103,10 +253,9 @@ def list_contents(archive_path: str, limit: int = 60) -> None:
     if not os.path.exists(archive_path):
         print(f"error: archive not found: {archive_path}", file=sys.stderr)
         sys.exit(2)
-    with tarfile.open(archive_path, "r:gz") as tf:
-        for i, m in enumerate(tf.getmembers()):
-            if i >= limit:
-                break
+    # Read headers lazily and stop after `limit` instead of indexing every member.
+    with _open_tar(archive_path, "r", stream=True) as tf:
+        for m in itertools.islice(tf, limit):
             print(m.name)
 
 
@@ -123,7 +272,9 @@ def main(argv: list[str] | None = None) -> int:
 
     p_pack = sub.add_parser("package", help="Create sealed archive using dist.whitelist.txt")
     p_pack.add_argument("--whitelist", default="dist.whitelist.txt")
-    p_pack.add_argument("--out", default=os.path.join("dist", "sealed-meta.tgz"))
+    p_pack.add_argument("--out", default=None, help="Defaults to dist/sealed-meta.tgz (or .tar.zst)")
+    p_pack.add_argument("--format", dest="fmt", choices=["gz", "zst"], default="gz")
+    p_pack.add_argument("--force", action="store_true", help="Rebuild even if the manifest is unchanged")
 
     p_ver = sub.add_parser("verify", help="Verify required files exist in the sealed archive")
     p_ver.add_argument("--archive", default=os.path.join("dist", "sealed-meta.tgz"))
@@ -142,7 +293,8 @@ def main(argv: list[str] | None = None) -> int:
 
     args = parser.parse_args(argv)
     if args.cmd == "package":
-        package(args.whitelist, args.out)
+        out = args.out or os.path.join("dist", "sealed-meta.tgz" if args.fmt == "gz" else "sealed-meta.tar.zst")
+        package(args.whitelist, out, args.fmt, args.force)
         return 0
     if args.cmd == "verify":
         verify(args.archive, args.expect)
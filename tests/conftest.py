@@ -0,0 +1,17 @@
+from pathlib import Path
+
+import pytest
+
+from ufsa_v2.utils.tracker import Tracker
+
+
+@pytest.fixture(scope="session")
+def fixtures() -> Path:
+    """Repository fixture directory used by the fixture-backed parsers."""
+    return Path("data/fixtures")
+
+
+@pytest.fixture
+def tracker(tmp_path: Path) -> Tracker:
+    """Fresh tracker writing to the test's tmp_path."""
+    return Tracker(tmp_path / "tracker.json")
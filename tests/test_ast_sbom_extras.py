@@ -7,10 +7,8 @@ from ufsa_v2.parsers import parser_ast_sql, parser_cyclonedx
 from ufsa_v2.utils.tracker import Tracker
 
 
-def test_sql_ast_foreign_key_relation_on_fixture(tmp_path: Path):
+def test_sql_ast_foreign_key_relation_on_fixture(fixtures: Path, tracker: Tracker):
     """Ensure FK from orders.user_id -> users.user_id is emitted as a relation."""
-    fixtures = Path("data/fixtures")
-    tracker = Tracker(tmp_path / "tracker.json")
 
     scheme = parser_ast_sql.parse(
         standard_id="internal_dw_schema",
@@ -29,7 +27,7 @@ def test_sql_ast_foreign_key_relation_on_fixture(tmp_path: Path):
     assert (tgt in c_src.related_match) or (tgt in c_src.related)
 
 
-def test_sql_ast_backtick_identifiers_and_fk(tmp_path: Path):
+def test_sql_ast_backtick_identifiers_and_fk(tracker: Tracker, tmp_path: Path):
     """Backtick/quote handling and FK detection for simple MySQL-style DDL."""
     ddl = (
         "CREATE TABLE `a` (\n"
@@ -46,7 +44,6 @@ def test_sql_ast_backtick_identifiers_and_fk(tmp_path: Path):
     sql_path = fixtures_dir / "quoted.sql"
     sql_path.write_text(ddl)
 
-    tracker = Tracker(tmp_path / "tracker.json")
     scheme = parser_ast_sql.parse(
         standard_id="quoted_schema",
         name="Quoted Identifiers Schema",
@@ -69,7 +66,7 @@ def test_sql_ast_backtick_identifiers_and_fk(tmp_path: Path):
     assert (tgt_id in src.related_match) or (tgt_id in src.related)
 
 
-def test_cyclonedx_enrichment_fields(tmp_path: Path):
+def test_cyclonedx_enrichment_fields(tracker: Tracker, tmp_path: Path):
     """CycloneDX parser captures licenses, hashes, and externalReferences in notes."""
     enriched = {
         "bomFormat": "CycloneDX",
@@ -100,7 +97,6 @@ def test_cyclonedx_enrichment_fields(tmp_path: Path):
     sbom_path = fixtures_dir / "sbom_enriched.json"
     sbom_path.write_text(json.dumps(enriched))
 
-    tracker = Tracker(tmp_path / "tracker.json")
     scheme = parser_cyclonedx.parse(
         standard_id="cyclonedx_enriched",
         name="CycloneDX Enriched",
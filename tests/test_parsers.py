@@ -1,5 +1,17 @@
+import csv
+import hashlib
+import io
+import json
+import pickle
 from pathlib import Path
+from types import SimpleNamespace
 
+import pytest
+
+from ufsa_v2 import engine
+from ufsa_v2.core_models import Concept, ConceptScheme
+from ufsa_v2.emitters.csv_emitter import emit_stream
+from ufsa_v2.emitters.mapping_emitter import emit_candidate_mappings
 from ufsa_v2.engine import emit_outputs, unify_schemes
 from ufsa_v2.parsers import (
     csv_parser,
@@ -9,14 +21,14 @@ from ufsa_v2.parsers import (
     rdf_parser,
 )
 from ufsa_v2.utils import fetcher as _fetcher
+from ufsa_v2.utils import scraper
 from ufsa_v2.utils.fetcher import graphql_fetch
+from ufsa_v2.utils.json_io import dump_json, iter_floats, load_json
 from ufsa_v2.utils.profiles import evaluate_profile
-from ufsa_v2.utils.tracker import Tracker
+from ufsa_v2.utils.tracker import Tracker, compute_mismatches
 
 
-def test_json_schema_parser(tmp_path: Path):
-    fixtures = Path("data/fixtures")
-    tracker = Tracker(tmp_path / "tracker.json")
+def test_json_schema_parser(fixtures: Path, tracker: Tracker):
     scheme = json_schema_parser.parse(
         standard_id="fhir_r4_patient",
         name="FHIR Patient",
@@ -29,9 +41,7 @@ def test_json_schema_parser(tmp_path: Path):
     assert scheme.concepts, "JSON schema should produce concepts"
 
 
-def test_json_schema_observation_parser(tmp_path: Path):
-    fixtures = Path("data/fixtures")
-    tracker = Tracker(tmp_path / "tracker.json")
+def test_json_schema_observation_parser(fixtures: Path, tracker: Tracker):
     scheme = json_schema_parser.parse(
         standard_id="fhir_r4_observation",
         name="FHIR Observation",
@@ -63,9 +73,7 @@ def test_fetcher_pin_verify(tmp_path: Path):
     assert _fetcher.verify(url, cache_dir, key) is True
 
 
-def test_csv_parser(tmp_path: Path):
-    fixtures = Path("data/fixtures")
-    tracker = Tracker(tmp_path / "tracker.json")
+def test_csv_parser(fixtures: Path, tracker: Tracker):
     scheme = csv_parser.parse(
         standard_id="iso_3166_1_a2",
         name="ISO 3166-1 A2",
@@ -78,9 +86,7 @@ def test_csv_parser(tmp_path: Path):
     assert any(c.endswith(":US") for c in scheme.concepts), "Should include US concept"
 
 
-def test_rdf_parser(tmp_path: Path):
-    fixtures = Path("data/fixtures")
-    tracker = Tracker(tmp_path / "tracker.json")
+def test_rdf_parser(fixtures: Path, tracker: Tracker):
     scheme = rdf_parser.parse(
         standard_id="w3c_skos_core",
         name="SKOS Core",
@@ -93,9 +99,7 @@ def test_rdf_parser(tmp_path: Path):
     assert scheme.concepts, "RDF parser should produce at least one concept"
 
 
-def test_iana_csv_parser(tmp_path: Path):
-    fixtures = Path("data/fixtures")
-    tracker = Tracker(tmp_path / "tracker.json")
+def test_iana_csv_parser(fixtures: Path, tracker: Tracker):
     scheme = iana_csv_parser.parse(
         standard_id="iana_mime_application",
         name="IANA MIME Application",
@@ -109,9 +113,21 @@ def test_iana_csv_parser(tmp_path: Path):
     assert any(c.notes.get("notation") == "application/json" for c in scheme.concepts.values())
 
 
-def test_shopify_fields_parser(tmp_path: Path):
-    fixtures = Path("data/fixtures")
-    tracker = Tracker(tmp_path / "tracker.json")
+def test_iana_iter_concepts_streams_to_csv(fixtures: Path, tracker: Tracker, tmp_path: Path):
+    kwargs = {
+        "standard_id": "iana_mime_application",
+        "specification_url": "fixtures://iana/application.csv",
+        "concept_scheme_uri": "http://ufsa.org/v2/standards/iana_mime_application",
+        "fixtures_dir": str(fixtures),
+        "tracker": tracker,
+    }
+    streamed = emit_stream(iana_csv_parser.iter_concepts(**kwargs), "streamed", tmp_path)
+    scheme = iana_csv_parser.parse(name="IANA MIME Application", governing_body="IETF / IANA", **kwargs)
+    full = emit_stream(scheme.concepts.values(), "full", tmp_path)
+    assert streamed.read_bytes() == full.read_bytes()
+
+
+def test_shopify_fields_parser(fixtures: Path, tracker: Tracker):
     scheme = fields_csv_parser.parse(
         standard_id="shopify_admin_product",
         name="Shopify Product",
@@ -124,9 +140,7 @@ def test_shopify_fields_parser(tmp_path: Path):
     assert any(c.label == "title" for c in scheme.concepts.values())
 
 
-def test_openfigi_fields_parser(tmp_path: Path):
-    fixtures = Path("data/fixtures")
-    tracker = Tracker(tmp_path / "tracker.json")
+def test_openfigi_fields_parser(fixtures: Path, tracker: Tracker):
     scheme = fields_csv_parser.parse(
         standard_id="openfigi_v3",
         name="OpenFIGI Mapping",
@@ -139,9 +153,7 @@ def test_openfigi_fields_parser(tmp_path: Path):
     assert any(c.label == "figi" for c in scheme.concepts.values())
 
 
-def test_shopify_order_fields_parser(tmp_path: Path):
-    fixtures = Path("data/fixtures")
-    tracker = Tracker(tmp_path / "tracker.json")
+def test_shopify_order_fields_parser(fixtures: Path, tracker: Tracker):
     scheme = fields_csv_parser.parse(
         standard_id="shopify_admin_order",
         name="Shopify Order",
@@ -154,10 +166,8 @@ def test_shopify_order_fields_parser(tmp_path: Path):
     assert any(c.label == "shippingAddress" for c in scheme.concepts.values())
 
 
-def test_idmap_emitter_outputs(tmp_path: Path):
+def test_idmap_emitter_outputs(fixtures: Path, tracker: Tracker, tmp_path: Path):
     # Use existing registry dir with sample YAMLs and a minimal scheme to trigger emit
-    fixtures = Path("data/fixtures")
-    tracker = Tracker(tmp_path / "tracker.json")
     # Parse one small scheme to satisfy emit_outputs requirements
     scheme = fields_csv_parser.parse(
         standard_id="openfigi_v3",
@@ -213,8 +223,6 @@ def test_graphql_fetch_offline_cache(tmp_path: Path):
     # No cache yet, offline should return None
     assert graphql_fetch(url, query, cache, offline=True) is None
     # Create a cached response to simulate prior fetch
-    import hashlib
-
     key_src = f"{url}\n{query}".encode()
     key = hashlib.sha256(key_src).hexdigest()
     path = cache / f"{key}.json"
@@ -224,18 +232,154 @@ def test_graphql_fetch_offline_cache(tmp_path: Path):
     assert got and got.exists()
 
 
-def test_scraper_extract_table_rows(tmp_path: Path):
-    from ufsa_v2.utils.scraper import extract_table_rows
-
-    html = """
+_TABLE_HTML = """
     <html><body>
     <table>
       <tr><th>Name</th><th>Price</th></tr>
       <tr><td>Widget</td><td>$10</td></tr>
+      <tr><td>Gadget</td><td></td></tr>
     </table>
     </body></html>
     """
+
+
+def test_scraper_extract_table_rows(tmp_path: Path):
     p = tmp_path / "t.html"
-    p.write_text(html)
-    rows = extract_table_rows(p)
+    p.write_text(_TABLE_HTML)
+    rows = scraper.extract_table_rows(p)
     assert rows and rows[0] == ["Name", "Price"] and rows[1] == ["Widget", "$10"]
+
+
+def test_scraper_selectolax_keeps_empty_cells_like_bs4():
+    pytest.importorskip("selectolax.lexbor")
+    # BeautifulSoup rows keep empty cells; only the regex fallback drops them.
+    assert scraper._extract_with_selectolax(_TABLE_HTML) == [["Name", "Price"], ["Widget", "$10"], ["Gadget", ""]]
+
+
+def test_dump_json_matches_stdlib_indent(tmp_path: Path):
+    payload = [{"label": "café", "score": 1.0}, {"label": "plain", "score": 1e-05, "notes": {}}]
+    p = tmp_path / "out.json"
+    dump_json(payload, p, floats=[1.0, 1e-05])
+    assert p.read_text() == json.dumps(payload, indent=2)
+    dump_json(payload[:1], p, floats=[1.0])
+    assert p.read_text() == json.dumps(payload[:1], indent=2)
+    odd = {"title": "a \u2014 b \U0001f600 \x7f\x1f", "big": 2**70, "nan": float("nan")}
+    dump_json(odd, p, floats=iter_floats(odd))
+    assert p.read_text() == json.dumps(odd, indent=2)
+    unlisted = {"scores": [1e16, 1e-07, 0.1]}
+    dump_json(unlisted, p)
+    assert p.read_text() == json.dumps(unlisted, indent=2)
+
+
+def test_parse_standards_parallel_matches_serial(fixtures: Path, tmp_path: Path, monkeypatch):
+    registry = engine.load_registry(Path("ufsa_v2/registry/pointer_registry.yaml"))
+    serial = Tracker(tmp_path / "serial.json")
+    expected = engine.parse_standards(registry.standards, fixtures.resolve(), serial)
+
+    monkeypatch.setattr(engine.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(engine, "PARALLEL_MIN_FIXTURE_BYTES", 0)
+    parallel = Tracker(tmp_path / "parallel.json")
+    got = engine.parse_standards(registry.standards, fixtures.resolve(), parallel)
+
+    assert got == expected
+    assert list(parallel.files.items()) == list(serial.files.items())
+
+
+def test_parse_cache_reuses_schemes_and_tracks_fixtures(fixtures: Path, tmp_path: Path, monkeypatch):
+    registry = engine.load_registry(Path("ufsa_v2/registry/pointer_registry.yaml"))
+    plain = Tracker(tmp_path / "plain.json")
+    expected = [engine.parse_standard(std, fixtures.resolve(), plain) for std in registry.standards]
+
+    monkeypatch.setenv(engine.PARSE_CACHE_ENV, str(tmp_path / "cache"))
+    # A miss hashes each fixture once: for the key, not again in the parser.
+    hashed: list[str] = []
+    track_file = Tracker.track_file
+
+    def counting_track_file(self, path, data=None):
+        hashed.append(str(path))
+        track_file(self, path, data)
+
+    monkeypatch.setattr(Tracker, "track_file", counting_track_file)
+    cold = Tracker(tmp_path / "cold.json")
+    assert [engine.parse_standard(std, fixtures.resolve(), cold) for std in registry.standards] == expected
+    assert cold.files == plain.files
+    assert len(hashed) == len(set(hashed)) == len(plain.files)
+    monkeypatch.setattr(Tracker, "track_file", track_file)
+
+    # A warm cache must not call the parsers at all.
+    import_module = engine.importlib.import_module
+    monkeypatch.setattr(
+        engine.importlib, "import_module", lambda name: SimpleNamespace(__file__=import_module(name).__file__)
+    )
+    warm = Tracker(tmp_path / "warm.json")
+    assert [engine.parse_standard(std, fixtures.resolve(), warm) for std in registry.standards] == expected
+    assert warm.files == plain.files
+
+    # Entries missing a core_models field are reparsed, not returned.
+    monkeypatch.setattr(engine.importlib, "import_module", import_module)
+    stale = Concept.__new__(Concept)
+    stale.id, stale.label = "x", "x"
+    for entry in (tmp_path / "cache").glob("parsed_*.pkl"):
+        entry.write_bytes(pickle.dumps(ConceptScheme(id="x", label="x", concepts={"x": stale})))
+    again = Tracker(tmp_path / "again.json")
+    assert [engine.parse_standard(std, fixtures.resolve(), again) for std in registry.standards] == expected
+
+
+def test_parse_cache_keys_on_sources_and_tolerates_bad_dirs(fixtures: Path, tmp_path: Path, monkeypatch):
+    std = engine.load_registry(Path("ufsa_v2/registry/pointer_registry.yaml")).standards[0]
+    cache = tmp_path / "cache"
+    monkeypatch.setenv(engine.PARSE_CACHE_ENV, str(cache))
+    expected = engine.parse_standard(std, fixtures.resolve(), Tracker(tmp_path / "t.json"))
+    # Editing any ufsa_v2 module (e.g. a helper the parser calls) is a new key.
+    monkeypatch.setattr(engine, "_package_source_digest", lambda: "edited")
+    assert engine.parse_standard(std, fixtures.resolve(), Tracker(tmp_path / "t.json")) == expected
+    assert len(list(cache.glob("parsed_*.pkl"))) == 2
+
+    # An unusable cache directory only disables the cache.
+    (tmp_path / "file").write_text("")
+    monkeypatch.setenv(engine.PARSE_CACHE_ENV, str(tmp_path / "file" / "cache"))
+    assert engine.parse_standard(std, fixtures.resolve(), Tracker(tmp_path / "t.json")) == expected
+    monkeypatch.setenv(engine.PARSE_CACHE_ENV, str(cache))
+
+    def failing_dumps(*args, **kwargs):
+        raise OSError
+
+    monkeypatch.setattr(engine.pickle, "dumps", failing_dumps)
+    monkeypatch.setattr(engine, "_package_source_digest", lambda: "edited again")
+    assert engine.parse_standard(std, fixtures.resolve(), Tracker(tmp_path / "t.json")) == expected
+    assert not list(cache.glob("*.tmp"))
+
+
+def test_candidate_mappings_csv_matches_csv_writer(tmp_path: Path):
+    candidates = [("a:1", "b:1", 1.0), ("a:2", "", 0.5), ('a:"3"', "b:3,x", 1.0), ("a:4", "b:\n4", 1.0)]
+    emit_candidate_mappings(candidates, tmp_path)
+    expected = io.StringIO(newline="")
+    w = csv.writer(expected)
+    w.writerow(["source", "target", "score"])
+    w.writerows(candidates)
+    assert (tmp_path / "mappings.candidates.csv").read_bytes().decode() == expected.getvalue()
+    # Clean ids take the direct-format path
+    emit_candidate_mappings(candidates[:2], tmp_path)
+    assert (tmp_path / "mappings.candidates.csv").read_bytes() == b"source,target,score\r\na:1,b:1,1.0\r\na:2,,0.5\r\n"
+
+
+def test_load_json_falls_back_for_non_strict_json(tmp_path: Path):
+    p = tmp_path / "doc.json"
+    p.write_text('{"big": 123456789012345678901234567890, "nan": NaN, "s": "caf\\u00e9"}')
+    got = load_json(p)
+    assert got["big"] == 123456789012345678901234567890 and got["s"] == "café"
+    assert json.dumps(got) == json.dumps(json.loads(p.read_text()))
+
+
+def test_compute_mismatches_reports_in_tracker_order(tmp_path: Path):
+    paths = [tmp_path / f"f{i}.txt" for i in range(4)]
+    for p in paths:
+        p.write_text(p.name)
+    t = Tracker(tmp_path / "t.json")
+    t.track_files(paths)
+    paths[1].unlink()
+    paths[2].write_text("changed")
+
+    got = compute_mismatches(t)
+    assert [(m["path"], m["exists"]) for m in got] == [(str(paths[1]), "false"), (str(paths[2]), "true")]
+    assert got[1]["actual_sha256"] != got[1]["expected_sha256"]
@@ -5,9 +5,7 @@ from ufsa_v2.parsers import parser_ast_sql, parser_cyclonedx
 from ufsa_v2.utils.tracker import Tracker
 
 
-def test_cyclonedx_fixture_parses_and_emits(tmp_path: Path):
-    fixtures = Path("data/fixtures")
-    tracker = Tracker(tmp_path / "tracker.json")
+def test_cyclonedx_fixture_parses_and_emits(fixtures: Path, tracker: Tracker, tmp_path: Path):
     scheme = parser_cyclonedx.parse(
         standard_id="cyclonedx_example",
         name="Example CycloneDX SBOM",
@@ -27,9 +25,7 @@ def test_cyclonedx_fixture_parses_and_emits(tmp_path: Path):
     assert any(p.endswith("cyclonedx_example.concepts.csv") for p in outputs)
 
 
-def test_sql_ast_fixture_parses_and_emits(tmp_path: Path):
-    fixtures = Path("data/fixtures")
-    tracker = Tracker(tmp_path / "tracker.json")
+def test_sql_ast_fixture_parses_and_emits(fixtures: Path, tracker: Tracker, tmp_path: Path):
     scheme = parser_ast_sql.parse(
         standard_id="internal_dw_schema",
         name="Internal Data Warehouse Schema",
@@ -0,0 +1,61 @@
+import importlib.util
+import os
+import tarfile
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location("seal_package", Path("scripts/seal_package.py"))
+assert _spec and _spec.loader
+seal_package = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(seal_package)
+
+
+def test_package_members_for_recursive_and_directory_lines(tmp_path: Path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    for rel in ("data/fixtures/top.sql", "data/fixtures/fhir/p.json", "data/fixtures/iso/deep/x.csv", "docs/a.md"):
+        Path(rel).parent.mkdir(parents=True, exist_ok=True)
+        Path(rel).write_text(rel)
+    Path("README.md").write_text("readme")
+    # `*/**` takes the subdirectories and everything below them but not top.sql;
+    # a directory line takes the whole tree.
+    Path("wl.txt").write_text("data/fixtures/*/**\ndocs/\nREADME.md\nmissing/*\n")
+
+    seal_package.package("wl.txt", "dist/sealed.tgz")
+    assert "warn: pattern matched no files: missing/*" in capsys.readouterr().out
+    with tarfile.open("dist/sealed.tgz") as tf:
+        assert tf.getnames() == [
+            "data/fixtures/fhir",
+            "data/fixtures/fhir/p.json",
+            "data/fixtures/iso",
+            "data/fixtures/iso/deep",
+            "data/fixtures/iso/deep/x.csv",
+            "docs",
+            "docs/a.md",
+            "README.md",
+        ]
+        member = tf.extractfile("data/fixtures/iso/deep/x.csv")
+        assert member is not None and member.read() == b"data/fixtures/iso/deep/x.csv"
+        assert tf.getmember("docs").isdir()
+
+
+def test_package_skips_unchanged_content(tmp_path: Path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    src = Path("src/a.txt")
+    src.parent.mkdir()
+    src.write_text("a")
+    Path("wl.txt").write_text("src/**\n")
+    out = "dist/sealed.tgz"
+
+    seal_package.package("wl.txt", out)
+    assert capsys.readouterr().out.startswith("created:")
+    assert Path(out + ".manifest.json").is_file()
+    seal_package.package("wl.txt", out)
+    assert capsys.readouterr().out.startswith("unchanged:")
+    # A new mtime alone (as after `make seal`) is not a content change.
+    os.utime(src, ns=(src.stat().st_atime_ns, src.stat().st_mtime_ns + 10**9))
+    seal_package.package("wl.txt", out)
+    assert capsys.readouterr().out.startswith("unchanged:")
+    src.write_text("ab")
+    seal_package.package("wl.txt", out)
+    assert capsys.readouterr().out.startswith("created:")
+    seal_package.package("wl.txt", out, force=True)
+    assert capsys.readouterr().out.startswith("created:")
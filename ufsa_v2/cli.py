@@ -7,22 +7,12 @@ validate registries and profiles, and use the offline-first fetcher utilities.
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 from pathlib import Path
 
-from .engine import run_pipeline
-from .utils.fetcher import (
-    fetch,
-    graphql_fetch,
-)
-from .utils.fetcher import (
-    pin as fetch_pin,
-)
-from .utils.fetcher import (
-    verify as fetch_verify,
-)
-from .utils.profiles import evaluate_profile
-from .utils.scraper import extract_table_rows
+# Handler-specific modules (engine, validator, fetcher, ...) are imported inside
+# their handlers so e.g. `tracker list` does not pay for jsonschema at startup.
 from .utils.tracker import (
     Tracker,
     compute_mismatches,
@@ -34,11 +24,12 @@ from .utils.tracker import (
     plan_seed_from_state,
     plan_stats,
 )
-from .utils.validator import validate_yaml_against_schema
 
 
 def _handle_run(args: argparse.Namespace) -> None:
     """Run the pipeline and print a JSON summary of emitted outputs."""
+    from .engine import run_pipeline
+
     args.out.mkdir(parents=True, exist_ok=True)
     tracker = Tracker(args.tracker)
     result = run_pipeline(registry_path=args.registry, out_dir=args.out, tracker=tracker)
@@ -107,10 +98,7 @@ def _handle_tracker(args: argparse.Namespace) -> None:
             )
         )
     elif args.tracker_cmd == "touch":
-        for rel in list(tracker.files.keys()):
-            path_obj = Path(rel)
-            if path_obj.exists():
-                tracker.track_file(path_obj)
+        tracker.track_files([p for p in map(Path, tracker.files) if p.exists()])
         tracker.save()
         print(json.dumps({"status": "ok", "message": "tracker updated"}, indent=2))
     elif args.tracker_cmd == "plan":
@@ -119,6 +107,8 @@ def _handle_tracker(args: argparse.Namespace) -> None:
 
 def _handle_registry(args: argparse.Namespace) -> None:
     """Validate identifier_systems.yaml and mappings.yaml against their schemas."""
+    from .utils.validator import validate_yaml_against_schema
+
     if args.registry_cmd == "validate":
         # Validate identifier_systems.yaml and mappings.yaml if present
         base = Path(__file__).parent / "registry"
@@ -142,6 +132,9 @@ def _handle_registry(args: argparse.Namespace) -> None:
 
 def _handle_profiles(args: argparse.Namespace) -> None:
     """Validate/apply/check profiles against build outputs."""
+    from .utils.profiles import evaluate_profile
+    from .utils.validator import validate_yaml_against_schema
+
     if args.profiles_cmd == "validate":
         try:
             schema = Path(__file__).parent / "registry" / "profile.schema.json"
@@ -170,6 +163,11 @@ def _handle_profiles(args: argparse.Namespace) -> None:
 
 def _handle_fetcher(args: argparse.Namespace) -> None:
     """Offline-first fetcher helpers: HTTP, pin/verify, HTML table scraper, GraphQL."""
+    from .utils.fetcher import fetch, graphql_fetch
+    from .utils.fetcher import pin as fetch_pin
+    from .utils.fetcher import verify as fetch_verify
+    from .utils.scraper import extract_table_rows
+
     if args.fetcher_cmd == "get":
         path = fetch(args.url, args.cache, offline=args.offline)
         print(
@@ -205,8 +203,9 @@ def _handle_fetcher(args: argparse.Namespace) -> None:
         )
 
 
-def main() -> None:
-    """CLI entrypoint."""
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; repeated ``main()`` calls reuse it."""
     parser = argparse.ArgumentParser(prog="ufsa-v2", description="UFSA v2 Engine")
     sub = parser.add_subparsers(dest="command", required=True)
 
@@ -297,8 +296,12 @@ def main() -> None:
     fet_graphql.add_argument("query", type=str)
     fet_graphql.add_argument("--cache", type=Path, default=Path(".cache"))
     fet_graphql.add_argument("--offline", action="store_true")
+    return parser
 
-    args = parser.parse_args()
+
+def main() -> None:
+    """CLI entrypoint."""
+    args = _build_parser().parse_args()
 
     if args.command == "run":
         _handle_run(args)
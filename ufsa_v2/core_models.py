@@ -14,7 +14,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Concept:
     """A single SKOS-like concept within a concept scheme.
 
@@ -35,6 +35,9 @@ class Concept:
         broad_match: External URIs that are broader matches (skos:broadMatch).
         narrow_match: External URIs that are narrower matches (skos:narrowMatch).
         related_match: External URIs that are related matches (skos:relatedMatch).
+
+    The mapping fields are rarely populated, so they default to a shared empty
+    tuple and only become lists on first :meth:`add_match`.
     """
 
     id: str
@@ -45,14 +48,22 @@ class Concept:
     related: list[str] = field(default_factory=list)
     in_scheme: str | None = None
     # SKOS mapping predicates (cross-scheme or external)
-    exact_match: list[str] = field(default_factory=list)
-    close_match: list[str] = field(default_factory=list)
-    broad_match: list[str] = field(default_factory=list)
-    narrow_match: list[str] = field(default_factory=list)
-    related_match: list[str] = field(default_factory=list)
-
-
-@dataclass
+    exact_match: list[str] | tuple[str, ...] = ()
+    close_match: list[str] | tuple[str, ...] = ()
+    broad_match: list[str] | tuple[str, ...] = ()
+    narrow_match: list[str] | tuple[str, ...] = ()
+    related_match: list[str] | tuple[str, ...] = ()
+
+    def add_match(self, predicate: str, uri: str) -> None:
+        """Append ``uri`` to a mapping field, e.g. ``add_match("exact_match", uri)``."""
+        current = getattr(self, predicate)
+        if isinstance(current, tuple):
+            current = list(current)
+            setattr(self, predicate, current)
+        current.append(uri)
+
+
+@dataclass(slots=True)
 class ConceptScheme:
     """A named collection of concepts belonging to a standard.
 
@@ -60,14 +71,17 @@ class ConceptScheme:
         id: Short identifier for the scheme (e.g., "iso_4217").
         label: Human-friendly name for the scheme.
         concepts: Mapping of concept_id -> Concept.
+        scheme_uri: Canonical URI of the scheme (the registry's
+            ``concept_scheme_uri``); set by ``engine.parse_standard``.
     """
 
     id: str
     label: str
     concepts: dict[str, Concept] = field(default_factory=dict)
+    scheme_uri: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UFSAStandard:
     """Pointer registry entry describing how to ingest a standard.
 
@@ -90,14 +104,14 @@ class UFSAStandard:
     concept_scheme_uri: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Registry:
     """A collection of standards to ingest in a pipeline run."""
 
     standards: list[UFSAStandard]
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
     """Results from a pipeline run.
 
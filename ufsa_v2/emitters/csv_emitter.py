@@ -1,23 +1,37 @@
 from __future__ import annotations
 
 import csv
+import json
+from collections.abc import Iterable
 from pathlib import Path
+from typing import TextIO
 
-from ufsa_v2.core_models import ConceptScheme
+from ufsa_v2.core_models import Concept, ConceptScheme
+
+# json.dumps builds a fresh JSONEncoder whenever non-default options are
+# passed; reuse one encoder for every notes_json cell instead.
+encode_notes = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def open_csv(path: Path) -> TextIO:
+    """Open ``path`` for ``csv.writer`` with a 1 MiB buffer.
+
+    The default buffer is the filesystem block size (often 4 KiB), i.e. one
+    write() per few KiB of rows; this matters on network/cloud mounts.
+    """
+    return path.open("w", newline="", encoding="utf-8", buffering=1 << 20)
 
 
 def emit(scheme: ConceptScheme, out_dir: Path) -> Path:
-    p = out_dir / f"{scheme.id}.concepts.csv"
-    with p.open("w", newline="", encoding="utf-8") as f:
+    return emit_stream(scheme.concepts.values(), scheme.id, out_dir)
+
+
+def emit_stream(concepts: Iterable[Concept], scheme_id: str, out_dir: Path) -> Path:
+    """Write ``<scheme_id>.concepts.csv`` from any concept iterable, one row per item as it arrives."""
+    p = out_dir / f"{scheme_id}.concepts.csv"
+    with open_csv(p) as f:
         writer = csv.writer(f)
         writer.writerow(["id", "label", "in_scheme", "notes_json"])
-        for c in scheme.concepts.values():
-            import json
-
-            writer.writerow([
-                c.id,
-                c.label,
-                c.in_scheme or "",
-                json.dumps(c.notes, ensure_ascii=False),
-            ])
+        # Feed the C writer a generator so rows are never materialized as a list.
+        writer.writerows((c.id, c.label, c.in_scheme or "", encode_notes(c.notes)) for c in concepts)
     return p
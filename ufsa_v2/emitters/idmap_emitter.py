@@ -2,15 +2,16 @@ from __future__ import annotations
 
 import csv
 import json
+import math
 from pathlib import Path
-from typing import Any
 
-import yaml  # type: ignore[import]
+from ufsa_v2.emitters.csv_emitter import open_csv
+from ufsa_v2.utils.yaml_io import load_yaml
 
 
-def _load_yaml(path: Path) -> Any:
-    data = yaml.safe_load(path.read_text())
-    return data
+def _format_confidence(x: float) -> str:
+    # Same text as json.dumps(x): repr for finite floats, JSON's NaN/Infinity spelling otherwise.
+    return repr(x) if math.isfinite(x) else json.dumps(x)
 
 
 def emit_identifier_systems(registry_dir: Path, out_dir: Path) -> str | None:
@@ -27,10 +28,10 @@ def emit_identifier_systems(registry_dir: Path, out_dir: Path) -> str | None:
     src = registry_dir / "identifier_systems.yaml"
     if not src.exists():
         return None
-    payload = _load_yaml(src)
+    payload = load_yaml(src)
     systems = payload.get("systems", []) if isinstance(payload, dict) else []
     out_path = out_dir / "identifier_systems.csv"
-    with out_path.open("w", newline="", encoding="utf-8") as f:
+    with open_csv(out_path) as f:
         w = csv.writer(f)
         w.writerow(["id", "name", "authority", "uri", "description"])
         for s in systems:
@@ -58,10 +59,10 @@ def emit_mappings(registry_dir: Path, out_dir: Path) -> str | None:
     src = registry_dir / "mappings.yaml"
     if not src.exists():
         return None
-    payload = _load_yaml(src)
+    payload = load_yaml(src)
     mappings = payload.get("mappings", []) if isinstance(payload, dict) else []
     out_path = out_dir / "mappings.csv"
-    with out_path.open("w", newline="", encoding="utf-8") as f:
+    with open_csv(out_path) as f:
         w = csv.writer(f)
         w.writerow(["subject", "predicate", "object", "confidence", "provenance"])
         for m in mappings:
@@ -69,7 +70,7 @@ def emit_mappings(registry_dir: Path, out_dir: Path) -> str | None:
                 str(m.get("subject", "")),
                 str(m.get("predicate", "")),
                 str(m.get("object", "")),
-                json.dumps(float(m.get("confidence", 1.0))),
+                _format_confidence(float(m.get("confidence", 1.0))),
                 str(m.get("provenance", "")),
             ])
     return str(out_path)
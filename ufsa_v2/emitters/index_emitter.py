@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import csv
-import json
 from pathlib import Path
 
 from ufsa_v2.core_models import ConceptScheme
+from ufsa_v2.emitters.csv_emitter import encode_notes, open_csv
+from ufsa_v2.utils.json_io import dump_json
 
 
 def emit_global_indexes(schemes: dict[str, ConceptScheme], out_dir: Path) -> list[str]:
@@ -23,12 +24,12 @@ def emit_global_indexes(schemes: dict[str, ConceptScheme], out_dir: Path) -> lis
                 "notes": c.notes,
             })
     p_json = out_dir / "concepts.all.json"
-    p_json.write_text(json.dumps(all_concepts, indent=2))
+    dump_json(all_concepts, p_json)
     out_paths.append(str(p_json))
 
     # Flat CSV list of all concepts
     p_csv = out_dir / "concepts.all.csv"
-    with p_csv.open("w", newline="", encoding="utf-8") as f:
+    with open_csv(p_csv) as f:
         w = csv.writer(f)
         w.writerow(["scheme", "scheme_label", "id", "label", "in_scheme", "notes_json"])
         for row in all_concepts:
@@ -38,7 +39,7 @@ def emit_global_indexes(schemes: dict[str, ConceptScheme], out_dir: Path) -> lis
                 row["id"],
                 row["label"],
                 row["in_scheme"] or "",
-                json.dumps(row["notes"], ensure_ascii=False),
+                encode_notes(row["notes"]),
             ])
     out_paths.append(str(p_csv))
 
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from ufsa_v2.core_models import ConceptScheme
+from ufsa_v2.utils.json_io import dump_json
 
 
 def emit(scheme: ConceptScheme, out_dir: Path) -> Path:
@@ -16,15 +16,15 @@ def emit(scheme: ConceptScheme, out_dir: Path) -> Path:
                 "label": c.label,
                 "notes": c.notes,
                 "in_scheme": c.in_scheme,
-                "exact_match": getattr(c, "exact_match", []),
-                "close_match": getattr(c, "close_match", []),
-                "broad_match": getattr(c, "broad_match", []),
-                "narrow_match": getattr(c, "narrow_match", []),
-                "related_match": getattr(c, "related_match", []),
+                "exact_match": c.exact_match,
+                "close_match": c.close_match,
+                "broad_match": c.broad_match,
+                "narrow_match": c.narrow_match,
+                "related_match": c.related_match,
             }
             for c in scheme.concepts.values()
         ],
     }
     p = out_dir / f"{scheme.id}.concepts.json"
-    p.write_text(json.dumps(payload, indent=2))
+    dump_json(payload, p)
     return p
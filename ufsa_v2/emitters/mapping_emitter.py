@@ -1,24 +1,42 @@
 from __future__ import annotations
 
 import csv
-import json
 from pathlib import Path
+from typing import Any
+
+from ufsa_v2.emitters.csv_emitter import open_csv
+from ufsa_v2.utils.json_io import dump_json
+
+_CHUNK_ROWS = 10_000
+
+
+def _write_rows(f: Any, rows: list[tuple[str, str, float]]) -> None:
+    """Write ``rows`` exactly as ``csv.writer`` would, skipping it when no field needs quoting.
+
+    A chunk is formatted directly and kept only if it holds exactly two commas,
+    one CRLF per row and no quote chars, i.e. no id contained a delimiter.
+    """
+    for i in range(0, len(rows), _CHUNK_ROWS):
+        chunk = rows[i : i + _CHUNK_ROWS]
+        text = "".join([f"{a},{b},{score}\r\n" for a, b, score in chunk])
+        n = len(chunk)
+        if text.count(",") == 2 * n and text.count("\n") == n and text.count("\r") == n and '"' not in text:
+            f.write(text)
+        else:
+            csv.writer(f).writerows(chunk)
 
 
 def emit_candidate_mappings(candidates: list[tuple[str, str, float]], out_dir: Path) -> list[str]:
     # JSON
     p_json = out_dir / "mappings.candidates.json"
-    p_json.write_text(
-        json.dumps(
-            [{"source": a, "target": b, "score": score} for a, b, score in candidates],
-            indent=2,
-        )
+    dump_json(
+        [{"source": a, "target": b, "score": score} for a, b, score in candidates],
+        p_json,
+        floats={score for _, _, score in candidates},
     )
     # CSV
     p_csv = out_dir / "mappings.candidates.csv"
-    with p_csv.open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(["source", "target", "score"])
-        for a, b, score in candidates:
-            w.writerow([a, b, score])
+    with open_csv(p_csv) as f:
+        csv.writer(f).writerow(["source", "target", "score"])
+        _write_rows(f, candidates)
     return [str(p_json), str(p_csv)]
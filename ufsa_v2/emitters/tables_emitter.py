@@ -11,60 +11,84 @@ This module writes the global tables described in the docs:
 from __future__ import annotations
 
 import csv
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 from ufsa_v2.core_models import Concept, ConceptScheme
+from ufsa_v2.emitters.csv_emitter import open_csv
+
+_DB_KINDS = frozenset({"table", "column"})
 
 
 def _write_concept_schemes_csv(
     schemes: dict[str, ConceptScheme], out_path: Path
 ) -> None:
     """Write ``concept_schemes.csv`` with id, label, URI, governing_body."""
-    with out_path.open("w", newline="", encoding="utf-8") as f:
+    with open_csv(out_path) as f:
         w = csv.writer(f)
         w.writerow(
             ["scheme_id", "scheme_label", "scheme_uri", "governing_body"]
         )  # governing_body not tracked yet
         for sch_id, sch in sorted(schemes.items()):
-            # Derive scheme_uri from first concept.in_scheme when available
-            scheme_uri = ""
-            for c in sch.concepts.values():
-                if c.in_scheme:
-                    scheme_uri = c.in_scheme
-                    break
             w.writerow(
-                [sch_id, sch.label, scheme_uri, ""]
+                [sch_id, sch.label, _scheme_uri(sch), ""]
             )  # governing_body placeholder
 
 
-def _write_concepts_csv(
-    schemes: dict[str, ConceptScheme], out_path: Path
-) -> None:
-    """Write ``concepts.csv`` excluding specialized kinds (software, db)."""
-    with out_path.open("w", newline="", encoding="utf-8") as f:
+def _scheme_uri(sch: ConceptScheme) -> str:
+    """Return the scheme URI, else the first concept's ``in_scheme`` for schemes built by hand."""
+    if sch.scheme_uri is not None:
+        return sch.scheme_uri
+    return next((c.in_scheme for c in sch.concepts.values() if c.in_scheme), "")
+
+
+def _bucket_by_kind(
+    schemes: dict[str, ConceptScheme],
+) -> tuple[list[Concept], list[Concept], list[Concept]]:
+    """Split concepts into (generic, software components, db tables/columns).
+
+    One pass over all schemes, so the writers below don't each re-scan and
+    re-classify every concept.
+    """
+    generic: list[Concept] = []
+    software: list[Concept] = []
+    db_objects: list[Concept] = []
+    for sch in schemes.values():
+        for c in sch.concepts.values():
+            kind = c.notes.get("kind", "")
+            if kind == "software_component":
+                software.append(c)
+            elif kind in _DB_KINDS:
+                db_objects.append(c)
+            else:
+                generic.append(c)
+    return generic, software, db_objects
+
+
+def _write_concepts_csv(concepts: list[Concept], out_path: Path) -> None:
+    """Write ``concepts.csv`` for the generic (non-specialized) concepts."""
+    with open_csv(out_path) as f:
         w = csv.writer(f)
         w.writerow(
             ["concept_id", "pref_label", "definition", "notation", "scheme_uri"]
         )  # aligns to docs
-        for sch in schemes.values():
-            for c in sch.concepts.values():
-                # Exclude specialized concepts that will be emitted into dedicated tables
-                kind = c.notes.get("kind", "")
-                if kind in {"software_component", "table", "column"}:
-                    continue
-                definition = c.notes.get("description", "")
-                notation = c.notes.get("notation", c.notes.get("code", ""))
-                w.writerow(
-                    [c.id, c.label, definition, notation, c.in_scheme or ""]
-                )
+        w.writerows(_concept_rows(concepts))
+
+
+def _concept_rows(concepts: list[Concept]) -> Iterator[tuple[str, ...]]:
+    for c in concepts:
+        notes = c.notes
+        definition = notes.get("description", "")
+        notation = notes.get("notation", notes.get("code", ""))
+        yield c.id, c.label, definition, notation, c.in_scheme or ""
 
 
 def _write_semantic_relations_csv(
     schemes: dict[str, ConceptScheme], out_path: Path
 ) -> None:
     """Write ``semantic_relations.csv`` listing SKOS-style triples."""
-    with out_path.open("w", newline="", encoding="utf-8") as f:
+    with open_csv(out_path) as f:
         w = csv.writer(f)
         w.writerow(
             ["subject_id", "predicate", "object_id"]
@@ -74,7 +98,7 @@ def _write_semantic_relations_csv(
                 _write_relations_for_concept(w, c)
 
 
-def _write_relations_for_concept(w: Any, c: Any) -> None:
+def _write_relations_for_concept(w: Any, c: Concept) -> None:
     """Helper to write all relations for a single concept to the CSV writer."""
     for b in c.broader:
         w.writerow([c.id, "skos:broader", b])
@@ -82,15 +106,15 @@ def _write_relations_for_concept(w: Any, c: Any) -> None:
         w.writerow([c.id, "skos:narrower", n])
     for r in c.related:
         w.writerow([c.id, "skos:related", r])
-    for x in getattr(c, "exact_match", []) or []:
+    for x in c.exact_match:
         w.writerow([c.id, "skos:exactMatch", x])
-    for x in getattr(c, "close_match", []) or []:
+    for x in c.close_match:
         w.writerow([c.id, "skos:closeMatch", x])
-    for x in getattr(c, "broad_match", []) or []:
+    for x in c.broad_match:
         w.writerow([c.id, "skos:broadMatch", x])
-    for x in getattr(c, "narrow_match", []) or []:
+    for x in c.narrow_match:
         w.writerow([c.id, "skos:narrowMatch", x])
-    for x in getattr(c, "related_match", []) or []:
+    for x in c.related_match:
         w.writerow([c.id, "skos:relatedMatch", x])
 
 
@@ -99,6 +123,7 @@ def emit_global_tables(
 ) -> list[str]:
     """Emit all global and specialized tables; return list of written paths."""
     out_paths: list[str] = []
+    generic, software, db_objects = _bucket_by_kind(schemes)
 
     # concept_schemes.csv
     p_schemes = out_dir / "concept_schemes.csv"
@@ -107,7 +132,7 @@ def emit_global_tables(
 
     # concepts.csv
     p_concepts = out_dir / "concepts.csv"
-    _write_concepts_csv(schemes, p_concepts)
+    _write_concepts_csv(generic, p_concepts)
     out_paths.append(str(p_concepts))
 
     # semantic_relations.csv
@@ -116,11 +141,11 @@ def emit_global_tables(
     out_paths.append(str(p_rel))
 
     # Specialized outputs
-    sw_path = _write_software_components(schemes, out_dir)
+    sw_path = _write_software_components(software, out_dir)
     if sw_path:
         out_paths.append(str(sw_path))
 
-    db_path = _write_database_schemas(schemes, out_dir)
+    db_path = _write_database_schemas(db_objects, out_dir)
     if db_path:
         out_paths.append(str(db_path))
 
@@ -128,17 +153,12 @@ def emit_global_tables(
 
 
 def _write_software_components(
-    schemes: dict[str, ConceptScheme], out_dir: Path
+    comps: list[Concept], out_dir: Path
 ) -> Path | None:
-    comps: list[Concept] = []
-    for sch in schemes.values():
-        for c in sch.concepts.values():
-            if c.notes.get("kind") == "software_component":
-                comps.append(c)
     if not comps:
         return None
     p_sw = out_dir / "software_components.csv"
-    with p_sw.open("w", newline="", encoding="utf-8") as f:
+    with open_csv(p_sw) as f:
         w = csv.writer(f)
         w.writerow(
             ["purl", "name", "version", "description", "scheme_uri"]
@@ -153,17 +173,12 @@ def _write_software_components(
 
 
 def _write_database_schemas(
-    schemes: dict[str, ConceptScheme], out_dir: Path
+    tables_cols: list[Concept], out_dir: Path
 ) -> Path | None:
-    tables_cols: list[Concept] = []
-    for sch in schemes.values():
-        for c in sch.concepts.values():
-            if c.notes.get("kind") in {"table", "column"}:
-                tables_cols.append(c)
     if not tables_cols:
         return None
     p_db = out_dir / "database_schemas.csv"
-    with p_db.open("w", newline="", encoding="utf-8") as f:
+    with open_csv(p_db) as f:
         w = csv.writer(f)
         w.writerow(
             ["table_name", "column_name", "data_type", "concept_uri"]
@@ -8,22 +8,48 @@ produce normalized artifacts. The runtime model is defined in
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import importlib
-import json
 import logging
+import os
+import pickle
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import fields
+from itertools import combinations
 from pathlib import Path
 from typing import Protocol, cast, runtime_checkable
 
-import yaml  # type: ignore[import]
-from jsonschema import validate as jsonschema_validate  # type: ignore[import]
-
 from .core_models import (
+    Concept,
     ConceptScheme,
     PipelineResult,
     Registry,
     UFSAStandard,
 )
+from .emitters import (
+    csv_emitter,
+    idmap_emitter,
+    index_emitter,
+    json_emitter,
+    mapping_emitter,
+    tables_emitter,
+)
+from .utils.json_io import dump_json
 from .utils.tracker import Tracker
+from .utils.validator import validate_against_schema
+from .utils.yaml_io import load_yaml
+
+# Below this many concepts in total, per-scheme files are emitted in-process;
+# pickling schemes to workers only pays off for large registries.
+PARALLEL_MIN_CONCEPTS = 20_000
+# Likewise for parsing: a few MiB of fixtures before worker start-up pays off.
+# Set UFSA_NO_PARALLEL=1 to always parse in-process.
+PARALLEL_MIN_FIXTURE_BYTES = 4 * 1024 * 1024
+# Set UFSA_PARSE_CACHE=<dir> to reuse parsed schemes across runs while neither
+# the fixture bytes, the parser module nor any ufsa_v2 source file change.
+PARSE_CACHE_ENV = "UFSA_PARSE_CACHE"
 
 
 def load_registry(path: Path) -> Registry:
@@ -35,15 +61,12 @@ def load_registry(path: Path) -> Registry:
     Returns:
         Parsed ``Registry`` object containing standards to ingest.
     """
-    data = yaml.safe_load(path.read_text())
-    # Validate against schema if available
+    data = load_yaml(path)
+    # Validate against schema if available (compiled schema is cached per mtime)
     schema_path = Path(__file__).parent / "registry" / "registry.schema.json"
     try:
         if schema_path.exists():
-            import json as _json
-
-            schema = _json.loads(schema_path.read_text())
-            jsonschema_validate(instance=data, schema=schema)
+            validate_against_schema(data, schema_path)
     except Exception:
         logging.getLogger(__name__).debug(
             "Registry schema validation skipped due to error", exc_info=True
@@ -95,6 +118,18 @@ def parse_standard(
     module_path = std.parser_module
     mod = importlib.import_module(module_path)
     parser = cast(_ParserModule, mod)
+    cache_path = _parse_cache_path(std, fixtures_dir, mod, tracker)
+    if cache_path is not None and cache_path.is_file():
+        try:
+            cached = pickle.loads(cache_path.read_bytes())  # noqa: S301 - our own cache dir
+        except Exception:
+            cached = None
+        if _is_current_scheme(cached):
+            return cast(ConceptScheme, cached)
+        logging.getLogger(__name__).debug("Ignoring unreadable or stale parse cache %s", cache_path)
+    if cache_path is not None:
+        # _parse_cache_path has just hashed the fixture; don't digest it again.
+        tracker = _PrehashedTracker(tracker, fixtures_dir / std.specification_url.removeprefix("fixtures://"))
     # Prefer fixture file path for deterministic bootstrap
     scheme = parser.parse(
         standard_id=std.standard_id,
@@ -105,9 +140,150 @@ def parse_standard(
         fixtures_dir=str(fixtures_dir),
         tracker=tracker,
     )
+    if scheme.scheme_uri is None:
+        scheme.scheme_uri = std.concept_scheme_uri
+    if cache_path is not None:
+        tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp.write_bytes(pickle.dumps(scheme, protocol=pickle.HIGHEST_PROTOCOL))
+            tmp.replace(cache_path)
+        except Exception:
+            # The cache is optional; a failed write only costs the next run a parse.
+            logging.getLogger(__name__).debug("Failed to write parse cache %s", cache_path, exc_info=True)
+            tmp.unlink(missing_ok=True)
     return scheme
 
 
+def _parse_cache_path(
+    std: UFSAStandard, fixtures_dir: Path, mod: object, tracker: Tracker
+) -> Path | None:
+    """Return the parse cache entry for ``std``, or None when caching is off.
+
+    The fixture is tracked here so a cache hit records the same provenance as a
+    parse; its sha256 keys the entry together with the registry fields, the
+    parser module's mtime and a digest of the ufsa_v2 sources (models and the
+    helpers parsers call). Returns None, so the run parses uncached, when the
+    cache directory cannot be created.
+    """
+    cache_dir = os.environ.get(PARSE_CACHE_ENV)
+    if not cache_dir or not std.specification_url.startswith("fixtures://"):
+        return None
+    fixture_path = fixtures_dir / std.specification_url.removeprefix("fixtures://")
+    if not fixture_path.is_file():
+        return None
+    tracker.track_file(fixture_path)
+    mod_file = getattr(mod, "__file__", None)
+    key = hashlib.sha256(
+        "\0".join([
+            tracker.files[str(fixture_path)]["sha256"],
+            std.standard_id,
+            std.name,
+            std.governing_body,
+            std.specification_url,
+            std.parser_module,
+            std.concept_scheme_uri,
+            str(Path(mod_file).stat().st_mtime_ns if mod_file else ""),
+            _package_source_digest(),
+        ]).encode()
+    ).hexdigest()
+    path = Path(cache_dir) / f"parsed_{key}.pkl"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        logging.getLogger(__name__).debug("Parse cache disabled; cannot create %s", cache_dir, exc_info=True)
+        return None
+    return path
+
+
+@functools.cache
+def _package_source_digest() -> str:
+    """Return a sha256 over every ufsa_v2 module, computed once per process."""
+    root = Path(__file__).parent
+    h = hashlib.sha256()
+    for p in sorted(root.rglob("*.py")):
+        h.update(f"{p.relative_to(root).as_posix()}\0".encode())
+        h.update(p.read_bytes())
+    return h.hexdigest()
+
+
+def _is_current_scheme(obj: object) -> bool:
+    """Return True if a cached ``obj`` unpickled into a complete ConceptScheme.
+
+    Slots dataclasses pickled before a field was added load without it, which
+    would otherwise only surface as an AttributeError while emitting.
+    """
+    if not isinstance(obj, ConceptScheme) or not all(hasattr(obj, f.name) for f in fields(ConceptScheme)):
+        return False
+    names = [f.name for f in fields(Concept)]
+    return all(isinstance(c, Concept) and all(hasattr(c, n) for n in names) for c in obj.concepts.values())
+
+
+class _PrehashedTracker(Tracker):
+    """View of ``tracker`` that skips re-hashing one file it already recorded."""
+
+    def __init__(self, tracker: Tracker, prehashed: Path) -> None:
+        self.path = tracker.path
+        self.files = tracker.files
+        self.meta = tracker.meta
+        self._prehashed = str(prehashed)
+
+    def track_file(self, path: Path, data: bytes | None = None) -> None:
+        if str(Path(path)) != self._prehashed:
+            super().track_file(path, data)
+
+
+class _WorkerTracker(Tracker):
+    """Tracker stand-in for parser worker processes; only collects file hashes."""
+
+    def __init__(self) -> None:
+        self.files = {}
+        self.meta = {}
+
+
+def _parse_in_worker(
+    std: UFSAStandard, fixtures_dir: Path
+) -> tuple[ConceptScheme, dict[str, dict[str, str]]]:
+    worker_tracker = _WorkerTracker()
+    scheme = parse_standard(std, fixtures_dir=fixtures_dir, tracker=worker_tracker)
+    return scheme, worker_tracker.files
+
+
+def _fixture_bytes(standards: list[UFSAStandard], fixtures_dir: Path) -> int:
+    total = 0
+    for std in standards:
+        if std.specification_url.startswith("fixtures://"):
+            p = fixtures_dir / std.specification_url.removeprefix("fixtures://")
+            if p.is_file():
+                total += p.stat().st_size
+    return total
+
+
+def parse_standards(
+    standards: list[UFSAStandard], fixtures_dir: Path, tracker: Tracker
+) -> list[ConceptScheme]:
+    """Parse every standard, in worker processes when the inputs are large enough.
+
+    Schemes are returned, and their fixture files tracked, in registry order.
+    """
+    workers = os.cpu_count() or 1
+    if (
+        workers == 1
+        or len(standards) < 2
+        or os.environ.get("UFSA_NO_PARALLEL") == "1"
+        or _fixture_bytes(standards, fixtures_dir) < PARALLEL_MIN_FIXTURE_BYTES
+    ):
+        return [parse_standard(std, fixtures_dir=fixtures_dir, tracker=tracker) for std in standards]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(standards))) as ex:
+        results = list(ex.map(_parse_in_worker, standards, [fixtures_dir] * len(standards)))
+    schemes: list[ConceptScheme] = []
+    for scheme, files in results:
+        tracker.files.update(files)
+        schemes.append(scheme)
+    return schemes
+
+
 def unify_schemes(schemes: list[ConceptScheme]) -> dict[str, ConceptScheme]:
     """Unify a list of schemes into a dict keyed by scheme id.
 
@@ -128,89 +304,87 @@ def emit_outputs(
     (concepts, relations, schemes), identifier/mapping registries, and mapping
     candidate sets. All outputs are tracked.
     """
-    outputs: list[str] = []
-    outputs += _emit_per_scheme_artifacts(schemes, out_dir, tracker)
-    outputs += _emit_indexes(schemes, out_dir, tracker)
-    outputs += _emit_global_tables_and_registries(schemes, out_dir, tracker)
-    return outputs
+    return list(iter_outputs(schemes, out_dir, tracker))
+
+
+def iter_outputs(
+    schemes: dict[str, ConceptScheme], out_dir: Path, tracker: Tracker
+) -> Iterator[str]:
+    """Lazily emit the artifacts of :func:`emit_outputs`, yielding each path once written and tracked."""
+    yield from _emit_per_scheme_artifacts(schemes, out_dir, tracker)
+    yield from _emit_indexes(schemes, out_dir, tracker)
+    yield from _emit_global_tables_and_registries(schemes, out_dir, tracker)
 
 
 def _emit_per_scheme_artifacts(
     schemes: dict[str, ConceptScheme], out_dir: Path, tracker: Tracker
-) -> list[str]:
-    json_emitter = importlib.import_module("ufsa_v2.emitters.json_emitter")
-    csv_emitter = importlib.import_module("ufsa_v2.emitters.csv_emitter")
-    out: list[str] = []
-    for scheme in schemes.values():
-        p1 = json_emitter.emit(scheme, out_dir)
-        p2 = csv_emitter.emit(scheme, out_dir)
-        for p in (p1, p2):
-            tracker.track_file(Path(p))
-            out.append(str(p))
-    return out
+) -> Iterator[str]:
+    workers = os.cpu_count() or 1
+    total = sum(len(sch.concepts) for sch in schemes.values())
+    if workers == 1 or len(schemes) < 2 or total < PARALLEL_MIN_CONCEPTS:
+        for sch in schemes.values():
+            yield from _track_paths(_emit_scheme(sch, out_dir), tracker)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(schemes))) as ex:
+        results = list(ex.map(_emit_scheme, schemes.values(), [out_dir] * len(schemes)))
+    # Hash in the parent, in scheme order, once every worker has finished.
+    yield from _track_paths([p for paths in results for p in paths], tracker)
+
+
+def _emit_scheme(scheme: ConceptScheme, out_dir: Path) -> tuple[Path, Path]:
+    """Write one scheme's JSON and CSV files (runs in a worker for large registries)."""
+    return json_emitter.emit(scheme, out_dir), csv_emitter.emit(scheme, out_dir)
+
+
+def _track_paths(paths: Iterable[Path | str], tracker: Tracker) -> Iterator[str]:
+    """Track a group of freshly written files in one batch, then yield them in order."""
+    paths = list(paths)
+    tracker.track_files(paths)
+    for p in paths:
+        yield str(p)
 
 
 def _emit_indexes(
     schemes: dict[str, ConceptScheme], out_dir: Path, tracker: Tracker
-) -> list[str]:
-    out: list[str] = []
+) -> Iterator[str]:
     # Write simple consolidated index
     index_path = out_dir / "concept_schemes.index.json"
     index_payload = {
         sch_id: {"label": sch.label, "concepts": list(sch.concepts.keys())}
         for sch_id, sch in schemes.items()
     }
-    index_path.write_text(json.dumps(index_payload, indent=2))
+    dump_json(index_payload, index_path)
     tracker.track_file(index_path)
-    out.append(str(index_path))
+    yield str(index_path)
     # Optional richer indexes
     try:
-        index_emitter = importlib.import_module(
-            "ufsa_v2.emitters.index_emitter"
-        )
-        if hasattr(index_emitter, "emit_global_indexes"):
-            for gp in index_emitter.emit_global_indexes(schemes, out_dir):
-                tracker.track_file(Path(gp))
-                out.append(str(gp))
+        yield from _track_paths(index_emitter.emit_global_indexes(schemes, out_dir), tracker)
     except Exception:
         logging.getLogger(__name__).debug(
             "Global index emission skipped", exc_info=True
         )
-    return out
 
 
 def _emit_global_tables_and_registries(
     schemes: dict[str, ConceptScheme], out_dir: Path, tracker: Tracker
-) -> list[str]:
-    out: list[str] = []
+) -> Iterator[str]:
     # Global tables
     try:
-        tables_emitter = importlib.import_module(
-            "ufsa_v2.emitters.tables_emitter"
-        )
-        if hasattr(tables_emitter, "emit_global_tables"):
-            for gp in tables_emitter.emit_global_tables(schemes, out_dir):
-                tracker.track_file(Path(gp))
-                out.append(str(gp))
+        yield from _track_paths(tables_emitter.emit_global_tables(schemes, out_dir), tracker)
     except Exception:
         logging.getLogger(__name__).debug(
             "Global tables emission skipped", exc_info=True
         )
     # Identifier/mapping registries
     try:
-        idmap_emitter = importlib.import_module(
-            "ufsa_v2.emitters.idmap_emitter"
-        )
         registry_dir = Path(__file__).parent / "registry"
-        if hasattr(idmap_emitter, "emit_idmap_tables"):
-            for gp in idmap_emitter.emit_idmap_tables(registry_dir, out_dir):
-                tracker.track_file(Path(gp))
-                out.append(str(gp))
+        yield from _track_paths(idmap_emitter.emit_idmap_tables(registry_dir, out_dir), tracker)
     except Exception:
         logging.getLogger(__name__).debug(
             "Identifier/mapping emission skipped", exc_info=True
         )
-    return out
 
 
 def _generate_mapping_candidates(
@@ -221,18 +395,11 @@ def _generate_mapping_candidates(
     Returns a list of (concept_id_a, concept_id_b, score) tuples.
     """
     # Build label -> concept ids per scheme
-    by_label: dict[str, list[str]] = {}
+    by_label: defaultdict[str, list[str]] = defaultdict(list)
     for sch in unified.values():
         for c in sch.concepts.values():
-            key = c.label.strip().lower()
-            by_label.setdefault(key, []).append(c.id)
-    candidates: list[tuple[str, str, float]] = []
-    for ids in by_label.values():
-        if len(ids) > 1:
-            for i in range(len(ids)):
-                for j in range(i + 1, len(ids)):
-                    candidates.append((ids[i], ids[j], 1.0))
-    return candidates
+            by_label[c.label.strip().lower()].append(c.id)
+    return [(a, b, 1.0) for ids in by_label.values() if len(ids) > 1 for a, b in combinations(ids, 2)]
 
 
 def run_pipeline(
@@ -258,10 +425,7 @@ def run_pipeline(
 
     # Fixtures alongside registry
     fixtures_dir = Path("data/fixtures").resolve()
-    schemes: list[ConceptScheme] = []
-    for std in registry.standards:
-        scheme = parse_standard(std, fixtures_dir=fixtures_dir, tracker=tracker)
-        schemes.append(scheme)
+    schemes = parse_standards(registry.standards, fixtures_dir=fixtures_dir, tracker=tracker)
 
     unified = unify_schemes(schemes)
     # Enrich tracker meta with scheme labels and counts
@@ -275,21 +439,13 @@ def run_pipeline(
         }
     tracker.meta["schemes"] = schemes_meta
     # Track key project files for drift prevention
-    for rel in ("pyproject.toml", "uv.lock", "README.md"):
-        p = Path(rel)
-        if p.exists():
-            tracker.track_file(p)
+    tracker.track_files([p for p in map(Path, ("pyproject.toml", "uv.lock", "README.md")) if p.exists()])
     outputs = emit_outputs(unified, out_dir=out_dir, tracker=tracker)
 
     # Generate naive cross-scheme candidate mappings by label equality
     try:
-        mapping_emitter = importlib.import_module(
-            "ufsa_v2.emitters.mapping_emitter"
-        )
         candidates = _generate_mapping_candidates(unified)
-        for gp in mapping_emitter.emit_candidate_mappings(candidates, out_dir):
-            tracker.track_file(Path(gp))
-            outputs.append(str(gp))
+        outputs.extend(_track_paths(mapping_emitter.emit_candidate_mappings(candidates, out_dir), tracker))
         tracker.meta["mappingCandidates"] = len(candidates)
     except Exception:
         logging.getLogger(__name__).debug(
@@ -0,0 +1,11 @@
+"""Helpers shared by the CSV-based parsers."""
+
+from __future__ import annotations
+
+
+def first_value(row: list[str], cols: list[int]) -> str:
+    """Return the first non-empty cell among ``cols``; short rows count as empty."""
+    for i in cols:
+        if i < len(row) and row[i]:
+            return row[i]
+    return ""
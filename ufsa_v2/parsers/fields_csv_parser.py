@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import csv
 import re
+from collections.abc import Iterator
 from pathlib import Path
 
 from ufsa_v2.core_models import Concept, ConceptScheme
+from ufsa_v2.parsers._common import first_value
 from ufsa_v2.utils.errors import FixtureURLRequiredError
 from ufsa_v2.utils.tracker import Tracker
 
@@ -13,40 +15,45 @@ _NON_ALNUM = re.compile(r"[^A-Za-z0-9_]+")
 
 def _slugify(text: str) -> str:
     s = text.strip().replace(" ", "_")
-    s = _NON_ALNUM.sub("_", s)
+    # Plain ASCII names (the common case) contain nothing for the regex to replace.
+    if not (s.isascii() and (s.isidentifier() or s.isalnum())):
+        s = _NON_ALNUM.sub("_", s)
     return s.strip("_").lower() or "field"
 
 
-def parse(
+def iter_concepts(
     *,
     standard_id: str,
-    name: str,
-    governing_body: str,
     specification_url: str,
     concept_scheme_uri: str,
     fixtures_dir: str,
     tracker: Tracker,
-):
-    """Parse a generic field list CSV with columns like Name, Description.
+) -> Iterator[Concept]:
+    """Yield one concept per named CSV row, without building a ``ConceptScheme``.
 
-    - Uses Name as label and generates a stable id from the name.
-    - Stores description in notes.description when present.
+    The fixture is checked and tracked immediately; rows are read lazily. Ids
+    may repeat when names slugify alike (``parse`` keeps the last one).
     """
     if not specification_url.startswith("fixtures://"):
         raise FixtureURLRequiredError()
     fixture_rel = specification_url.replace("fixtures://", "")
     fixture_path = Path(fixtures_dir) / fixture_rel
     tracker.track_file(fixture_path)
+    return _iter_rows(fixture_path, standard_id, concept_scheme_uri)
 
-    scheme = ConceptScheme(id=standard_id, label=name)
 
+def _iter_rows(fixture_path: Path, standard_id: str, concept_scheme_uri: str) -> Iterator[Concept]:
     with fixture_path.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        # Resolve columns once from the header (last duplicate wins, as with DictReader).
+        pos = {h: i for i, h in enumerate(next(reader, []))}
+        name_cols = [pos[k] for k in ("Name", "name") if k in pos]
+        desc_cols = [pos[k] for k in ("Description", "description") if k in pos]
         for row in reader:
             if not row:
                 continue
-            name_val = (row.get("Name") or row.get("name") or "").strip()
-            desc_val = (row.get("Description") or row.get("description") or "").strip()
+            name_val = first_value(row, name_cols).strip()
+            desc_val = first_value(row, desc_cols).strip()
             if not name_val:
                 continue
             slug = _slugify(name_val)
@@ -55,7 +62,32 @@ def parse(
             if desc_val:
                 c.notes["description"] = desc_val
             c.in_scheme = concept_scheme_uri
-            scheme.concepts[c.id] = c
+            yield c
+
+
+def parse(
+    *,
+    standard_id: str,
+    name: str,
+    governing_body: str,
+    specification_url: str,
+    concept_scheme_uri: str,
+    fixtures_dir: str,
+    tracker: Tracker,
+):
+    """Parse a generic field list CSV with columns like Name, Description.
+
+    - Uses Name as label and generates a stable id from the name.
+    - Stores description in notes.description when present.
+    """
+    concepts = iter_concepts(
+        standard_id=standard_id,
+        specification_url=specification_url,
+        concept_scheme_uri=concept_scheme_uri,
+        fixtures_dir=fixtures_dir,
+        tracker=tracker,
+    )
+    scheme = ConceptScheme(id=standard_id, label=name, concepts={c.id: c for c in concepts})
 
     # Post-processing for known relations (e.g., OpenFIGI composite/share class)
     if standard_id == "openfigi_v3":
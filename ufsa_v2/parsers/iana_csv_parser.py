@@ -1,44 +1,48 @@
 from __future__ import annotations
 
 import csv
+from collections.abc import Iterator
 from pathlib import Path
 
 from ufsa_v2.core_models import Concept, ConceptScheme
+from ufsa_v2.parsers._common import first_value
 from ufsa_v2.utils.errors import FixtureURLRequiredError
 from ufsa_v2.utils.tracker import Tracker
 
 
-def parse(
+def iter_concepts(
     *,
     standard_id: str,
-    name: str,
-    governing_body: str,
     specification_url: str,
     concept_scheme_uri: str,
     fixtures_dir: str,
     tracker: Tracker,
-):
-    """Parse an IANA-style MIME CSV (expects columns like Name, Template).
+) -> Iterator[Concept]:
+    """Yield one concept per complete CSV row, without building a ``ConceptScheme``.
 
-    Creates concepts where label=Name and notation=Template (full media type).
-    Tolerates different capitalizations.
+    The fixture is checked and tracked immediately; rows are read lazily. Ids
+    may repeat for duplicate templates (``parse`` keeps the last one).
     """
     if not specification_url.startswith("fixtures://"):
         raise FixtureURLRequiredError()
     fixture_rel = specification_url.replace("fixtures://", "")
     fixture_path = Path(fixtures_dir) / fixture_rel
     tracker.track_file(fixture_path)
+    return _iter_rows(fixture_path, standard_id, concept_scheme_uri)
 
-    scheme = ConceptScheme(id=standard_id, label=name)
 
+def _iter_rows(fixture_path: Path, standard_id: str, concept_scheme_uri: str) -> Iterator[Concept]:
     with fixture_path.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        # Resolve columns once from the lower-cased header (last duplicate wins).
+        pos = {h.lower(): i for i, h in enumerate(next(reader, []))}
+        label_cols = [pos[k] for k in ("name", "label", "type") if k in pos]
+        notation_cols = [pos[k] for k in ("template", "mime", "value") if k in pos]
         for row in reader:
             if not row:
                 continue
-            keys = {k.lower(): (v or "") for k, v in row.items()}
-            label = keys.get("name") or keys.get("label") or keys.get("type")
-            notation = keys.get("template") or keys.get("mime") or keys.get("value")
+            label = first_value(row, label_cols)
+            notation = first_value(row, notation_cols)
             if not (label and notation):
                 # Skip incomplete rows
                 continue
@@ -47,6 +51,30 @@ def parse(
             cid = f"{standard_id}:{slug}"
             c = Concept(id=cid, label=label, notes={"notation": notation})
             c.in_scheme = concept_scheme_uri
-            scheme.concepts[c.id] = c
+            yield c
+
 
+def parse(
+    *,
+    standard_id: str,
+    name: str,
+    governing_body: str,
+    specification_url: str,
+    concept_scheme_uri: str,
+    fixtures_dir: str,
+    tracker: Tracker,
+):
+    """Parse an IANA-style MIME CSV (expects columns like Name, Template).
+
+    Creates concepts where label=Name and notation=Template (full media type).
+    Tolerates different capitalizations.
+    """
+    concepts = iter_concepts(
+        standard_id=standard_id,
+        specification_url=specification_url,
+        concept_scheme_uri=concept_scheme_uri,
+        fixtures_dir=fixtures_dir,
+        tracker=tracker,
+    )
+    scheme = ConceptScheme(id=standard_id, label=name, concepts={c.id: c for c in concepts})
     return scheme
@@ -5,6 +5,7 @@ from pathlib import Path
 
 from ufsa_v2.core_models import Concept, ConceptScheme
 from ufsa_v2.utils.errors import FixtureURLRequiredError
+from ufsa_v2.utils.json_io import loads_json
 from ufsa_v2.utils.tracker import Tracker
 
 
@@ -23,9 +24,10 @@ def parse(
         raise FixtureURLRequiredError()
     fixture_rel = specification_url.replace("fixtures://", "")
     fixture_path = Path(fixtures_dir) / fixture_rel
-    text = fixture_path.read_text()
-    tracker.track_file(fixture_path)
-    data = json.loads(text)
+    # Read once: the same bytes are hashed for the tracker and parsed.
+    raw = fixture_path.read_bytes()
+    tracker.track_file(fixture_path, raw)
+    data = loads_json(raw)
 
     scheme = ConceptScheme(id=standard_id, label=name)
 
@@ -7,6 +7,7 @@ table and column concepts, with hierarchical and related relations.
 from __future__ import annotations
 
 import re
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +15,20 @@ from ufsa_v2.core_models import Concept, ConceptScheme
 from ufsa_v2.utils.errors import FixtureURLRequiredError
 from ufsa_v2.utils.tracker import Tracker
 
+# naive: split by CREATE TABLE ... (...);
+_TABLE_RE = re.compile(
+    r"CREATE\s+TABLE\s+(?P<name>[\w\.`\"]+)\s*\((?P<body>.*?)\);",
+    re.IGNORECASE | re.DOTALL,
+)
+_COL_RE = re.compile(
+    r"^\s*([`\"']?)(?P<col>[\w]+)\1\s+(?P<type>[\w\(\)\,\s]+)",
+    re.IGNORECASE,
+)
+_FK_RE = re.compile(
+    r"FOREIGN\s+KEY\s*\(\s*([`\"']?)(?P<src>[\w]+)\1\s*\)\s*REFERENCES\s+([`\"']?)(?P<tgt_table>[\w]+)\3\s*\(\s*([`\"']?)(?P<tgt_col>[\w]+)\5\s*\)",
+    re.IGNORECASE,
+)
+
 
 def _parse_sql_tables(sql_text: str) -> list[dict[str, Any]]:
     """Very small parser for simple CREATE TABLE blocks used in fixtures.
@@ -21,20 +36,7 @@ def _parse_sql_tables(sql_text: str) -> list[dict[str, Any]]:
     Returns a list of {table: str, columns: list[{name: str, type: str}]}
     """
     tables: list[dict[str, Any]] = []
-    # naive: split by CREATE TABLE ... (...);
-    pattern = re.compile(
-        r"CREATE\s+TABLE\s+(?P<name>[\w\.`\"]+)\s*\((?P<body>.*?)\);",
-        re.IGNORECASE | re.DOTALL,
-    )
-    col_pat = re.compile(
-        r"^\s*([`\"']?)(?P<col>[\w]+)\1\s+(?P<type>[\w\(\)\,\s]+)",
-        re.IGNORECASE,
-    )
-    fk_pat = re.compile(
-        r"FOREIGN\s+KEY\s*\(\s*([`\"']?)(?P<src>[\w]+)\1\s*\)\s*REFERENCES\s+([`\"']?)(?P<tgt_table>[\w]+)\3\s*\(\s*([`\"']?)(?P<tgt_col>[\w]+)\5\s*\)",
-        re.IGNORECASE,
-    )
-    for m in pattern.finditer(sql_text):
+    for m in _TABLE_RE.finditer(sql_text):
         tname = m.group("name").strip().strip('"').strip("`")
         body = m.group("body")
         cols: list[dict[str, str]] = []
@@ -43,8 +45,11 @@ def _parse_sql_tables(sql_text: str) -> list[dict[str, Any]]:
             line = line.strip().rstrip(",")
             if not line:
                 continue
-            if line.upper().startswith("FOREIGN KEY"):
-                fm = fk_pat.search(line)
+            # Both constraint keywords are 11 chars: classify on that prefix only
+            # rather than upper-casing the whole line per check.
+            keyword = line[:11].upper()
+            if keyword == "FOREIGN KEY":
+                fm = _FK_RE.search(line)
                 if fm:
                     fkeys.append({
                         "src": fm.group("src"),
@@ -52,9 +57,9 @@ def _parse_sql_tables(sql_text: str) -> list[dict[str, Any]]:
                         "tgt_col": fm.group("tgt_col"),
                     })
                 continue
-            if line.upper().startswith("PRIMARY KEY"):
+            if keyword == "PRIMARY KEY":
                 continue
-            cm = col_pat.match(line)
+            cm = _COL_RE.match(line)
             if cm:
                 cols.append({"name": cm.group("col"), "type": cm.group("type").strip()})
         tables.append({"table": tname, "columns": cols, "fkeys": fkeys})
@@ -92,7 +97,8 @@ def parse(
             c_con = Concept(
                 id=c_id,
                 label=f"{t['table']}.{col['name']}",
-                notes={"data_type": col.get("type", ""), "kind": "column"},
+                # Column types repeat heavily (INT, VARCHAR(255), ...); share one str each.
+                notes={"data_type": sys.intern(col.get("type", "")), "kind": "column"},
             )
             c_con.in_scheme = concept_scheme_uri
             # parent relation
@@ -104,11 +110,6 @@ def parse(
             src_col_id = f"{standard_id}:{t['table']}.{fk['src']}"
             tgt_col_id = f"{standard_id}:{fk['tgt_table']}.{fk['tgt_col']}"
             if src_col_id in scheme.concepts and tgt_col_id in scheme.concepts:
-                src = scheme.concepts[src_col_id]
-                # Use related_match if model supports; else append to related
-                if hasattr(src, "related_match"):
-                    src.related_match.append(tgt_col_id)
-                else:
-                    src.related.append(tgt_col_id)
+                scheme.concepts[src_col_id].add_match("related_match", tgt_col_id)
 
     return scheme
@@ -6,12 +6,13 @@ Transforms a minimal CycloneDX JSON (components/dependencies) into a
 
 from __future__ import annotations
 
-import json
+import sys
 from pathlib import Path
 from typing import Any
 
 from ufsa_v2.core_models import Concept, ConceptScheme
 from ufsa_v2.utils.errors import FixtureURLRequiredError
+from ufsa_v2.utils.json_io import loads_json
 from ufsa_v2.utils.tracker import Tracker
 
 
@@ -37,9 +38,11 @@ def parse(
         raise FixtureURLRequiredError()
     fixture_rel = specification_url.replace("fixtures://", "")
     fixture_path = Path(fixtures_dir) / fixture_rel
-    tracker.track_file(fixture_path)
+    # Read once: the same bytes are hashed for the tracker and parsed.
+    raw = fixture_path.read_bytes()
+    tracker.track_file(fixture_path, raw)
 
-    data: dict[str, Any] = json.loads(fixture_path.read_text())
+    data: dict[str, Any] = loads_json(raw)
     scheme = ConceptScheme(id=standard_id, label=name)
 
     # Build concepts
@@ -50,9 +53,7 @@ def parse(
         purl = str(comp.get("purl", "")).strip()
         description = str(comp.get("description", "")).strip()
         # optional enrichments
-        licenses = _collect_licenses(comp)
-        hashes = _collect_hashes(comp)
-        ext_refs = _collect_external_references(comp)
+        licenses, hashes, ext_refs = _collect_enrichments(comp)
 
         raw_ref = str(comp.get("bom-ref", "")).strip()
         # prefer bom-ref, else purl, else name@version
@@ -70,11 +71,9 @@ def parse(
                 "description": description,
                 "purl": purl,
                 "kind": "software_component",
-                "licenses": (
-                    ";".join([x for x in licenses if x]) if licenses else ""
-                ),
-                "hashes": ";".join(hashes) if hashes else "",
-                "externalReferences": ";".join(ext_refs) if ext_refs else "",
+                "licenses": licenses,
+                "hashes": hashes,
+                "externalReferences": ext_refs,
             },
         )
         c.in_scheme = concept_scheme_uri
@@ -87,46 +86,48 @@ def parse(
         if name_val or version:
             ref_to_concept_id.setdefault(f"{name_val}@{version}", c.id)
 
-    # Dependencies: link as skos:related
+    # Dependencies: link as skos:related. A set per source keeps the
+    # duplicate check O(1) while `related` preserves first-seen order.
+    linked: dict[str, set[str]] = {}
     for dep in data.get("dependencies", []) or []:
         ref = str(dep.get("ref", "")).strip()
         src_id = ref_to_concept_id.get(ref)
         if not src_id:
             continue
+        related = scheme.concepts[src_id].related
+        seen = linked.setdefault(src_id, set(related))
         for tgt in dep.get("dependsOn", []) or []:
             tgt_id = ref_to_concept_id.get(str(tgt))
-            if tgt_id and tgt_id not in scheme.concepts[src_id].related:
-                scheme.concepts[src_id].related.append(tgt_id)
+            if tgt_id and tgt_id not in seen:
+                seen.add(tgt_id)
+                related.append(tgt_id)
 
     return scheme
 
 
-def _collect_licenses(comp: dict[str, Any]) -> list[str]:
-    result: list[str] = []
-    for item in comp.get("licenses", []) or []:
-        lic = item.get("license") or {}
+def _collect_enrichments(comp: dict[str, Any]) -> tuple[str, str, str]:
+    """Return the ``;``-joined licenses, hashes and external reference URLs of ``comp``."""
+    licenses: list[str] = []
+    for item in comp.get("licenses") or ():
         expr = item.get("expression")
         if expr:
-            result.append(str(expr))
-        elif lic:
-            result.append(str(lic.get("id") or lic.get("name") or ""))
-    return result
-
-
-def _collect_hashes(comp: dict[str, Any]) -> list[str]:
-    result: list[str] = []
-    for h in comp.get("hashes", []) or []:
+            licenses.append(str(expr))
+        else:
+            lic = item.get("license")
+            if lic:
+                value = str(lic.get("id") or lic.get("name") or "")
+                if value:
+                    licenses.append(value)
+    hashes: list[str] = []
+    for h in comp.get("hashes") or ():
         alg = str(h.get("alg", "")).upper()
         val = str(h.get("content", ""))
         if alg and val:
-            result.append(f"{alg}:{val}")
-    return result
-
-
-def _collect_external_references(comp: dict[str, Any]) -> list[str]:
-    result: list[str] = []
-    for er in comp.get("externalReferences", []) or []:
+            hashes.append(f"{alg}:{val}")
+    ext_refs: list[str] = []
+    for er in comp.get("externalReferences") or ():
         url = str(er.get("url", "")).strip()
         if url:
-            result.append(url)
-    return result
+            ext_refs.append(url)
+    # A handful of license expressions (MIT, Apache-2.0) cover most components.
+    return sys.intern(";".join(licenses)), ";".join(hashes), ";".join(ext_refs)
@@ -10,6 +10,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from rdflib import RDF, RDFS, SKOS, Graph
+from rdflib.term import Node
 
 from ufsa_v2.core_models import Concept, ConceptScheme
 from ufsa_v2.utils.errors import FixtureURLRequiredError
@@ -38,9 +39,12 @@ def parse(
 
     scheme = ConceptScheme(id=standard_id, label=name)
 
-    # Collect SKOS Concepts with labels and enrich with SKOS properties
+    # Collect SKOS Concepts with labels and enrich with SKOS properties. Each
+    # subject's predicate/object pairs are read once and bucketed, instead of one
+    # indexed lookup per SKOS property.
     for s in g.subjects(RDF.type, SKOS.Concept):
-        pref_label = g.value(s, SKOS.prefLabel) or g.value(s, RDFS.label)
+        objs = _objects_by_predicate(g, s)
+        pref_label = _first(objs, SKOS.prefLabel) or _first(objs, RDFS.label)
         if not pref_label:
             # If no label, skip to keep output meaningful
             continue
@@ -49,21 +53,20 @@ def parse(
         c.in_scheme = concept_scheme_uri
 
         # Notes: definition, notation; include altLabel for context if present
-        definition = g.value(s, SKOS.definition)
+        definition = _first(objs, SKOS.definition)
         if definition:
             c.notes["description"] = str(definition)
         # Collect all notations (join when multiple)
-        notations = [str(n) for n in g.objects(s, SKOS.notation)]
+        notations = [str(n) for n in objs.get(SKOS.notation, ())]
         if notations:
             c.notes["notation"] = ";".join(notations)
         # altLabels (optional, semicolon-separated)
-        alt_labels = [str(al) for al in g.objects(s, SKOS.altLabel)]
+        alt_labels = [str(al) for al in objs.get(SKOS.altLabel, ())]
         if alt_labels:
             c.notes["altLabel"] = ";".join(alt_labels)
 
         scheme.concepts[c.id] = c
-
-    _wire_relations_and_mappings(g, standard_id, scheme)
+        _wire_relations_and_mappings(objs, standard_id, c)
 
     if not scheme.concepts:
         # fallback: add the scheme node itself
@@ -74,35 +77,39 @@ def parse(
     return scheme
 
 
+def _objects_by_predicate(g: Graph, s: Node) -> dict[Node, list[Node]]:
+    """Group the objects of ``s`` by predicate, keeping ``g.objects(s, p)`` order."""
+    objs: dict[Node, list[Node]] = {}
+    for p, o in g.predicate_objects(s):
+        objs.setdefault(p, []).append(o)
+    return objs
+
+
+def _first(objs: dict[Node, list[Node]], predicate: Node) -> Node | None:
+    """Same pick as ``g.value(s, predicate)``: the first object, if any."""
+    values = objs.get(predicate)
+    return values[0] if values else None
+
+
+_RELATIONS = (
+    (SKOS.broader, "broader"),
+    (SKOS.narrower, "narrower"),
+    (SKOS.related, "related"),
+)
+_MAPPINGS = (
+    (SKOS.exactMatch, "exact_match"),
+    (SKOS.closeMatch, "close_match"),
+    (SKOS.broadMatch, "broad_match"),
+    (SKOS.narrowMatch, "narrow_match"),
+    (SKOS.relatedMatch, "related_match"),
+)
+
+
 def _wire_relations_and_mappings(
-    g: Graph, standard_id: str, scheme: ConceptScheme
+    objs: dict[Node, list[Node]], standard_id: str, src: Concept
 ) -> None:
-    for s in g.subjects(RDF.type, SKOS.Concept):
-        src_id = f"{standard_id}:{s}"
-        src = scheme.concepts.get(src_id)
-        if not src:
-            continue
-        _add_relations(g, s, standard_id, src)
-        _add_mappings(g, s, src)
-
-
-def _add_relations(g: Graph, s, standard_id: str, src: Concept) -> None:  # type: ignore[name-defined]
-    for o in g.objects(s, SKOS.broader):
-        src.broader.append(f"{standard_id}:{o}")
-    for o in g.objects(s, SKOS.narrower):
-        src.narrower.append(f"{standard_id}:{o}")
-    for o in g.objects(s, SKOS.related):
-        src.related.append(f"{standard_id}:{o}")
-
-
-def _add_mappings(g: Graph, s, src: Concept) -> None:  # type: ignore[name-defined]
-    for o in g.objects(s, SKOS.exactMatch):
-        src.exact_match.append(str(o))
-    for o in g.objects(s, SKOS.closeMatch):
-        src.close_match.append(str(o))
-    for o in g.objects(s, SKOS.broadMatch):
-        src.broad_match.append(str(o))
-    for o in g.objects(s, SKOS.narrowMatch):
-        src.narrow_match.append(str(o))
-    for o in g.objects(s, SKOS.relatedMatch):
-        src.related_match.append(str(o))
+    for predicate, attr in _RELATIONS:
+        getattr(src, attr).extend(f"{standard_id}:{o}" for o in objs.get(predicate, ()))
+    for predicate, field in _MAPPINGS:
+        for o in objs.get(predicate, ()):
+            src.add_match(field, str(o))
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import hashlib
+import json
 from pathlib import Path
 
 
@@ -8,6 +10,12 @@ def _cache_key(url: str) -> str:
     return hashlib.sha256(url.encode("utf-8")).hexdigest()
 
 
+@functools.lru_cache(maxsize=4096)
+def _gql_cache_key(url: str, query: str) -> str:
+    # Polling loops repeat the same (url, query); skip re-hashing the query text.
+    return hashlib.sha256(f"{url}\n{query}".encode()).hexdigest()
+
+
 def fetch(
     url: str, cache_dir: Path, offline: bool = True, timeout: int = 10
 ) -> Path | None:
@@ -63,11 +71,8 @@ def graphql_fetch(
     - If offline and cached present, return path; else None.
     - If online, perform HTTP POST with JSON body {"query": query} and cache the response.
     """
-    import json as _json
-
     cache_dir.mkdir(parents=True, exist_ok=True)
-    key_src = f"{url}\n{query}"
-    key = hashlib.sha256(key_src.encode("utf-8")).hexdigest()
+    key = _gql_cache_key(url, query)
     path = cache_dir / f"{key}.json"
     if path.exists():
         return path
@@ -76,7 +81,7 @@ def graphql_fetch(
     try:
         import urllib.request
 
-        payload = _json.dumps({"query": query}).encode("utf-8")
+        payload = json.dumps({"query": query}).encode("utf-8")
         req = urllib.request.Request(  # noqa: S310
             url,
             data=payload,
@@ -0,0 +1,101 @@
+"""JSON file I/O shared by the parsers, emitters and the engine.
+
+Uses orjson when installed; the bytes written are always identical to
+``json.dumps(obj, indent=2)`` so tracker hashes do not depend on it, and
+anything orjson refuses to read is handed to the stdlib parser.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+# Optional accelerator; output is always byte-identical to stdlib json.
+orjson: Any | None = None
+try:
+    import orjson as _orjson  # type: ignore[import]
+
+    orjson = _orjson
+except Exception:  # pragma: no cover
+    orjson = None
+
+
+def _same_float_repr(x: float) -> bool:
+    # orjson and repr() only disagree on exponent notation (1e-05 vs 0.00001,
+    # 1e+16 vs 1e16) and on nan/inf, none of which occur in this range.
+    return x == 0 or 1e-4 <= abs(x) < 1e16
+
+
+_NOT_ASCII = re.compile(r"[^\x00-\x7e]")
+
+
+def _escape_char(m: re.Match[str]) -> str:
+    # json's ensure_ascii form: \uXXXX in lower-case hex, surrogate pairs above the BMP.
+    n = ord(m.group())
+    if n < 0x10000:
+        return f"\\u{n:04x}"
+    n -= 0x10000
+    return f"\\u{0xD800 | (n >> 10):04x}\\u{0xDC00 | (n & 0x3FF):04x}"
+
+
+def dumps_indented(obj: Any, *, floats: Iterable[float] | None = None) -> bytes:
+    """Return ``json.dumps(obj, indent=2)`` as bytes, via orjson when available.
+
+    stdlib escapes non-ASCII and DEL characters while orjson writes them raw, so
+    those are escaped afterwards the same way (they only occur inside strings).
+    orjson spells some floats differently, so the payload falls back to stdlib
+    when any of its floats is out of range. They are found with
+    :func:`iter_floats` unless the caller already has them and passes ``floats``.
+    """
+    if floats is None:
+        floats = iter_floats(obj)
+    if orjson is not None and all(_same_float_repr(x) for x in floats):
+        try:
+            out = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # e.g. ints beyond 64 bits or non-str keys, which json accepts
+            pass
+        else:
+            if out.isascii() and b"\x7f" not in out:
+                return out
+            return _NOT_ASCII.sub(_escape_char, out.decode()).encode()
+    return json.dumps(obj, indent=2).encode()
+
+
+def iter_floats(obj: Any) -> Iterator[float]:
+    """Yield every float nested in ``obj``'s dicts and lists, for ``floats=``."""
+    if isinstance(obj, float):
+        yield obj
+    elif isinstance(obj, dict):
+        for v in obj.values():
+            yield from iter_floats(v)
+    elif isinstance(obj, list | tuple):
+        for v in obj:
+            yield from iter_floats(v)
+
+
+def dump_json(obj: Any, path: Path, *, floats: Iterable[float] | None = None) -> None:
+    """Write ``obj`` to ``path`` as indented JSON (see :func:`dumps_indented`)."""
+    path.write_bytes(dumps_indented(obj, floats=floats))
+
+
+def loads_json(raw: bytes) -> Any:
+    """Parse JSON ``raw`` bytes, via orjson when available.
+
+    orjson is stricter than ``json`` (UTF-8 only, no NaN/Infinity, 64-bit ints),
+    so documents it rejects are re-parsed with ``json.loads``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def load_json(path: Path) -> Any:
+    """Parse the JSON file at ``path`` (see :func:`loads_json`)."""
+    return loads_json(path.read_bytes())
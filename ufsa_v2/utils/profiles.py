@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import csv
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -9,13 +10,13 @@ _ERR_PYYAML_REQUIRED = "pyyaml is required for profile operations"
 _ERR_PROFILE_MAPPING = "profile YAML must be a mapping"
 
 # Allow environments without pyyaml; keep a typed reference for type checkers.
-yaml: Any | None = None
+load_yaml: Any | None = None
 try:
-    import yaml as _yaml  # type: ignore[import]
+    from .yaml_io import load_yaml as _load_yaml
 
-    yaml = _yaml
+    load_yaml = _load_yaml
 except Exception:  # pragma: no cover
-    yaml = None
+    load_yaml = None
 
 
 @dataclass
@@ -24,15 +25,34 @@ class ProfileViolation:
     message: str
 
 
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
 def _load_profile(path: Path) -> dict[str, Any]:
-    if yaml is None:
+    return _parse_profile(path, _mtime_ns(path))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_profile(path: Path, mtime_ns: int | None) -> dict[str, Any]:
+    # mtime_ns only keys the cache so an edited profile is re-read.
+    if load_yaml is None:
         raise RuntimeError(_ERR_PYYAML_REQUIRED)
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    data = load_yaml(path)
     if not isinstance(data, dict):
         raise TypeError(_ERR_PROFILE_MAPPING)
     return data
 
 
+@functools.lru_cache(maxsize=64)
+def _concept_label_set(concepts_csv: Path, mtime_ns: int | None) -> frozenset[str]:
+    # Repeated checks against an unchanged build reuse the parsed labels.
+    return frozenset(_load_concepts_labels(concepts_csv))
+
+
 def _load_concepts_labels(concepts_csv: Path) -> list[str]:
     labels: list[str] = []
     if not concepts_csv.exists():
@@ -51,11 +71,12 @@ def evaluate_profile(profile_path: Path, build_dir: Path) -> dict[str, Any]:
 
     - Supports: cardinality: required for path names matching concept labels.
     - Returns a report with violations and a pass/fail flag.
+    - Parsed profiles and label sets are memoized on (path, mtime).
     """
     prof = _load_profile(profile_path)
     constraints = prof.get("spec", {}).get("constraints", [])
     concepts_csv = build_dir / "concepts.csv"
-    labels = set(_load_concepts_labels(concepts_csv))
+    labels = _concept_label_set(concepts_csv, _mtime_ns(concepts_csv))
     violations: list[ProfileViolation] = []
 
     for c in constraints:
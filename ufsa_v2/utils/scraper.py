@@ -3,6 +3,21 @@ from __future__ import annotations
 import re
 from html import unescape
 from pathlib import Path
+from typing import Any
+
+_TABLE_RE = re.compile(r"<table\b[^>]*>(.*?)</table>", re.I | re.S)
+_TR_RE = re.compile(r"<tr\b[^>]*>(.*?)</tr>", re.I | re.S)
+_CELL_RE = re.compile(r"<(?:th|td)\b[^>]*>(.*?)</(?:th|td)>", re.I | re.S)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Optional C-backed HTML parser, preferred over BeautifulSoup when installed.
+HTMLParser: Any | None = None
+try:
+    from selectolax.lexbor import LexborHTMLParser as _HTMLParser  # type: ignore[import]
+
+    HTMLParser = _HTMLParser
+except Exception:  # pragma: no cover
+    HTMLParser = None
 
 
 def _extract_with_regex(html_text: str) -> list[list[str]]:
@@ -12,20 +27,18 @@ def _extract_with_regex(html_text: str) -> list[list[str]]:
     """
     rows: list[list[str]] = []
     # Find the first <table>...</table>
-    m = re.search(r"<table\b[^>]*>(.*?)</table>", html_text, re.I | re.S)
+    m = _TABLE_RE.search(html_text)
     if not m:
         return rows
     table_html = m.group(1)
     # Find each row
-    for tr in re.finditer(r"<tr\b[^>]*>(.*?)</tr>", table_html, re.I | re.S):
+    for tr in _TR_RE.finditer(table_html):
         tr_html = tr.group(1)
         cells = []
-        for cell in re.finditer(
-            r"<(?:th|td)\b[^>]*>(.*?)</(?:th|td)>", tr_html, re.I | re.S
-        ):
+        for cell in _CELL_RE.finditer(tr_html):
             raw = cell.group(1)
             # Strip any nested tags naively
-            text = re.sub(r"<[^>]+>", "", raw)
+            text = _TAG_RE.sub("", raw)
             text = unescape(text).strip()
             if text:
                 cells.append(text)
@@ -34,8 +47,23 @@ def _extract_with_regex(html_text: str) -> list[list[str]]:
     return rows
 
 
+def _extract_with_selectolax(html_text: str) -> list[list[str]]:
+    """Same rows as the BeautifulSoup path, using selectolax's C-backed parser."""
+    rows: list[list[str]] = []
+    table = HTMLParser(html_text).css_first("table")
+    if table is None:
+        return rows
+    for tr in table.css("tr"):
+        cols = [c.text(deep=True, separator="", strip=True) for c in tr.css("th, td")]
+        if cols:
+            rows.append(cols)
+    return rows
+
+
 def extract_table_rows(html_path: Path) -> list[list[str]]:
     html_text = html_path.read_text(encoding="utf-8")
+    if HTMLParser is not None:
+        return _extract_with_selectolax(html_text)
     try:
         from bs4 import BeautifulSoup  # type: ignore[import]
     except Exception:  # pragma: no cover
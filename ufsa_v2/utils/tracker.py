@@ -3,18 +3,40 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
-import platform
+import os
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 
 def file_sha256(path: Path) -> str:
-    h = hashlib.sha256()
+    # file_digest reads into one reusable buffer; no per-chunk bytes objects.
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+# Below this many bytes in total, files are hashed serially; thread start-up
+# costs more than it overlaps for small build outputs.
+PARALLEL_HASH_MIN_BYTES = 4 * 1024 * 1024
+
+
+def _file_sha256_many(paths: list[Path]) -> list[str]:
+    """Hash ``paths`` in order, on a thread pool when there is enough to overlap.
+
+    hashlib releases the GIL while digesting, so reads and hashes overlap.
+    """
+    if len(paths) < 2 or (os.cpu_count() or 1) == 1 or sum(p.stat().st_size for p in paths) < PARALLEL_HASH_MIN_BYTES:
+        return [file_sha256(p) for p in paths]
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor() as ex:
+        return list(ex.map(file_sha256, paths))
+
+
+# Trackers at least this large are parsed via json_io (orjson when installed);
+# below it the accelerator's import costs more than it saves.
+ORJSON_LOAD_MIN_BYTES = 1024 * 1024
 
 
 @dataclass
@@ -28,7 +50,13 @@ class Tracker:
         self._log = logging.getLogger(__name__)
         if self.path.exists():
             try:
-                data = json.loads(self.path.read_text())
+                raw = self.path.read_bytes()
+                if len(raw) >= ORJSON_LOAD_MIN_BYTES:
+                    from ufsa_v2.utils.json_io import loads_json
+
+                    data = loads_json(raw)
+                else:
+                    data = json.loads(raw)
                 self.files = data.get("files", {})
                 self.meta = data.get("meta", {})
             except Exception:
@@ -39,13 +67,24 @@ class Tracker:
             self.files = {}
             self.meta = {}
 
-    def track_file(self, path: Path) -> None:
+    def track_file(self, path: Path, data: bytes | None = None) -> None:
+        """Record ``path``'s sha256; pass ``data`` when its bytes are already in memory."""
         path = Path(path)
         rel = str(path)
         self.files[rel] = {
-            "sha256": file_sha256(path),
+            "sha256": file_sha256(path) if data is None else hashlib.sha256(data).hexdigest(),
         }
 
+    def track_files(self, paths: Iterable[Path | str]) -> None:
+        """Track many files, hashing them on a thread pool when they are large enough.
+
+        Results are recorded in input order once all digests are done.
+        """
+        paths = [Path(p) for p in paths]
+        digests = _file_sha256_many(paths)
+        for p, digest in zip(paths, digests, strict=True):
+            self.files[str(p)] = {"sha256": digest}
+
     def save(self) -> None:
         # Timestamp
         try:
@@ -57,6 +96,8 @@ class Tracker:
             logging.getLogger(__name__).debug("Failed to set generatedAt in tracker metadata", exc_info=True)
 
         # Environment basics
+        import platform
+
         self.meta["python"] = platform.python_version()
 
         # Git metadata (best-effort)
@@ -68,27 +109,24 @@ class Tracker:
             if not git:
                 logging.getLogger(__name__).debug("git not found in PATH")
             else:
-                head = _sp.run(  # noqa: S603 - git path resolved, args constant
-                    [git, "rev-parse", "HEAD"],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=2,
-                ).stdout.strip()
-                branch = _sp.run(  # noqa: S603 - git path resolved, args constant
-                    [git, "rev-parse", "--abbrev-ref", "HEAD"],
+                # One process prints both: the commit, then the abbreviated ref.
+                out = _sp.run(  # noqa: S603 - git path resolved, args constant
+                    [git, "rev-parse", "HEAD", "--abbrev-ref", "HEAD"],
                     check=True,
                     capture_output=True,
                     text=True,
                     timeout=2,
-                ).stdout.strip()
+                ).stdout
+                head, branch = (line.strip() for line in out.splitlines())
                 self.meta["git"] = {"commit": head, "branch": branch}
         except Exception:
             logging.getLogger(__name__).debug("Git metadata not available", exc_info=True)
 
-        # Write JSON
+        # Write JSON (files holds only strings; meta is free-form, so check its floats)
+        from ufsa_v2.utils.json_io import dump_json, iter_floats
+
         payload = {"meta": self.meta, "files": self.files}
-        self.path.write_text(json.dumps(payload, indent=2))
+        dump_json(payload, self.path, floats=iter_floats(self.meta))
 
         # Write human-friendly markdown
         try:
@@ -99,9 +137,10 @@ class Tracker:
             for k, v in sorted(self.meta.items()):
                 lines.append(f"- {k}: {v}\n")
             lines.append("\n## Files\n\n")
-            for rel, info in sorted(self.files.items()):
-                lines.append(f"- {rel}  \n")
-                lines.append(f"  - sha256: `{info.get('sha256', '')}`\n")
+            # One formatted string per file entry
+            lines.extend(
+                f"- {rel}  \n  - sha256: `{info.get('sha256', '')}`\n" for rel, info in sorted(self.files.items())
+            )
             md_path.write_text("".join(lines))
         except Exception:
             logging.getLogger(__name__).debug("Failed to write TRACKER.md", exc_info=True)
@@ -110,13 +149,21 @@ class Tracker:
 def compute_mismatches(tracker: Tracker) -> list[dict[str, str]]:
     """Compute mismatches between tracked file hashes and current filesystem.
 
+    Existing files are hashed as in ``Tracker.track_files``; mismatches are
+    reported in tracker order.
+
     Returns a list of dicts with keys: path, expected_sha256, actual_sha256, exists
     """
+    # os.path on the str keys: one Path per existing file (for hashing), not two per entry.
+    present = [rel for rel in tracker.files if os.path.exists(rel)]
+    digests = _file_sha256_many([Path(rel) for rel in present])
+    actual_by_rel = dict(zip(present, digests, strict=True))
+
     mismatches: list[dict[str, str]] = []
     for rel, info in tracker.files.items():
-        p = Path(rel)
         expected = info.get("sha256", "")
-        if not p.exists():
+        actual = actual_by_rel.get(rel)
+        if actual is None:
             mismatches.append({
                 "path": rel,
                 "expected_sha256": expected,
@@ -124,7 +171,6 @@ def compute_mismatches(tracker: Tracker) -> list[dict[str, str]]:
                 "exists": "false",
             })
             continue
-        actual = file_sha256(p)
         if actual != expected:
             mismatches.append({
                 "path": rel,
@@ -166,18 +212,30 @@ def _next_task_id(tasks: list[PlanTask]) -> int:
 
 
 def plan_add_task(tracker: Tracker, task: PlanTask) -> PlanTask:
+    return plan_add_tasks(tracker, [task])[0]
+
+
+def plan_add_tasks(tracker: Tracker, new_tasks: list[PlanTask]) -> list[PlanTask]:
+    """Append ``new_tasks`` in order, numbering them as repeated ``plan_add_task`` would.
+
+    Existing ids are scanned once per batch rather than once per task.
+    """
     plan = _ensure_plan(tracker)
     tasks: list[PlanTask] = plan["tasks"]
-    if "id" not in task:
-        task["id"] = _next_task_id(tasks)
-    # defaults
-    task.setdefault("status", "todo")  # todo | in-progress | done | blocked
-    task.setdefault("priority", "medium")  # low | medium | high
-    task.setdefault("domain", "infrastructure")
-    task.setdefault("category", "feature")
-    tasks.append(task)
-    plan["updatedAt"] = tracker.meta.get("generatedAt", "")
-    return task
+    next_id = _next_task_id(tasks)
+    for task in new_tasks:
+        if "id" not in task:
+            task["id"] = next_id
+        next_id = max(next_id, _next_task_id([task]))
+        # defaults
+        task.setdefault("status", "todo")  # todo | in-progress | done | blocked
+        task.setdefault("priority", "medium")  # low | medium | high
+        task.setdefault("domain", "infrastructure")
+        task.setdefault("category", "feature")
+        tasks.append(task)
+    if new_tasks:
+        plan["updatedAt"] = tracker.meta.get("generatedAt", "")
+    return new_tasks
 
 
 def plan_mark_task(tracker: Tracker, task_id: int, status: str) -> bool:
@@ -359,10 +417,7 @@ def plan_seed_from_docs(tracker: Tracker) -> list[PlanTask]:
         "Doc 1, Section IV/V",
     )
 
-    created: list[PlanTask] = []
-    for s in seeds:
-        created.append(plan_add_task(tracker, s))
-    return created
+    return plan_add_tasks(tracker, seeds)
 
 
 def plan_seed_from_sbom_ast(tracker: Tracker) -> list[PlanTask]:
@@ -448,17 +503,14 @@ def plan_seed_from_sbom_ast(tracker: Tracker) -> list[PlanTask]:
         "SEAL scans ufsa_v2/; whitelist already captures sealed outputs",
     )
 
-    created: list[PlanTask] = []
-    for s in seeds:
-        created.append(plan_add_task(tracker, s))
-    return created
+    return plan_add_tasks(tracker, seeds)
 
 
 def plan_seed_from_state(tracker: Tracker) -> list[PlanTask]:
     """Seed tasks representing current achievements and plumbing based on tracker state."""
     plan = _ensure_plan(tracker)
     existing_titles = {str(t.get("title", "")) for t in plan["tasks"]}
-    created: list[PlanTask] = []
+    seeds: list[PlanTask] = []
 
     # Per-scheme integrations
     schemes = tracker.meta.get("schemes", {})
@@ -476,20 +528,15 @@ def plan_seed_from_state(tracker: Tracker) -> list[PlanTask]:
                     else ("finance" if str(sch_id).startswith("openfigi_") else "foundational")
                 )
             )
-            created.append(
-                plan_add_task(
-                    tracker,
-                    {
-                        "title": title,
-                        "domain": domain,
-                        "category": "coverage",
-                        "priority": "medium",
-                        "status": "done",
-                        "rationale": "Integrated via fixtures and parsers",
-                        "doc_ref": "Docs 1 & 2",
-                    },
-                )
-            )
+            seeds.append({
+                "title": title,
+                "domain": domain,
+                "category": "coverage",
+                "priority": "medium",
+                "status": "done",
+                "rationale": "Integrated via fixtures and parsers",
+                "doc_ref": "Docs 1 & 2",
+            })
 
     # Outputs plumbing
     files = tracker.files
@@ -503,73 +550,53 @@ def plan_seed_from_state(tracker: Tracker) -> list[PlanTask]:
         and _tracked("build/semantic_relations.csv")
         and "Emit global tables" not in existing_titles
     ):
-        created.append(
-            plan_add_task(
-                tracker,
-                {
-                    "title": "Emit global tables",
-                    "domain": "infrastructure",
-                    "category": "emitter",
-                    "priority": "high",
-                    "status": "done",
-                    "rationale": "Global CSV tables are present in build/",
-                    "doc_ref": "Doc 2, outputs",
-                },
-            )
-        )
+        seeds.append({
+            "title": "Emit global tables",
+            "domain": "infrastructure",
+            "category": "emitter",
+            "priority": "high",
+            "status": "done",
+            "rationale": "Global CSV tables are present in build/",
+            "doc_ref": "Doc 2, outputs",
+        })
     if (
         _tracked("build/concept_schemes.index.json")
         and _tracked("build/concepts.all.json")
         and "Emit consolidated indexes" not in existing_titles
     ):
-        created.append(
-            plan_add_task(
-                tracker,
-                {
-                    "title": "Emit consolidated indexes",
-                    "domain": "infrastructure",
-                    "category": "emitter",
-                    "priority": "medium",
-                    "status": "done",
-                    "rationale": "Index and aggregates present in build/",
-                    "doc_ref": "Doc 2, outputs",
-                },
-            )
-        )
+        seeds.append({
+            "title": "Emit consolidated indexes",
+            "domain": "infrastructure",
+            "category": "emitter",
+            "priority": "medium",
+            "status": "done",
+            "rationale": "Index and aggregates present in build/",
+            "doc_ref": "Doc 2, outputs",
+        })
     if (
         tracker.meta.get("mappingCandidates", 0)
         and _tracked("build/mappings.candidates.json")
         and "Generate mapping candidates" not in existing_titles
     ):
-        created.append(
-            plan_add_task(
-                tracker,
-                {
-                    "title": "Generate mapping candidates",
-                    "domain": "infrastructure",
-                    "category": "mapping",
-                    "priority": "medium",
-                    "status": "done",
-                    "rationale": "Naive label-equality candidates generated",
-                    "doc_ref": "Doc 2, mapping",
-                },
-            )
-        )
+        seeds.append({
+            "title": "Generate mapping candidates",
+            "domain": "infrastructure",
+            "category": "mapping",
+            "priority": "medium",
+            "status": "done",
+            "rationale": "Naive label-equality candidates generated",
+            "doc_ref": "Doc 2, mapping",
+        })
 
     # Developer ergonomics present
     if Path("Makefile").exists() and "Makefile targets and uv scripts" not in existing_titles:
-        created.append(
-            plan_add_task(
-                tracker,
-                {
-                    "title": "Makefile targets and uv scripts",
-                    "domain": "infrastructure",
-                    "category": "ops",
-                    "priority": "low",
-                    "status": "done",
-                    "rationale": "Makefile present; uv scripts configured in pyproject",
-                    "doc_ref": "Ops",
-                },
-            )
-        )
-    return created
+        seeds.append({
+            "title": "Makefile targets and uv scripts",
+            "domain": "infrastructure",
+            "category": "ops",
+            "priority": "low",
+            "status": "done",
+            "rationale": "Makefile present; uv scripts configured in pyproject",
+            "doc_ref": "Ops",
+        })
+    return plan_add_tasks(tracker, seeds)
@@ -1,22 +1,40 @@
 from __future__ import annotations
 
+import functools
 import json
 from pathlib import Path
 from typing import Any
 
-import yaml  # type: ignore[import]
-from jsonschema import validate as jsonschema_validate  # type: ignore[import]
+from jsonschema import exceptions as jsonschema_exceptions  # type: ignore[import]
+from jsonschema import validators as jsonschema_validators  # type: ignore[import]
 
-
-def _load_yaml(path: Path) -> Any:
-    return yaml.safe_load(path.read_text())
+from .yaml_io import load_yaml
 
 
 def _load_json(path: Path) -> Any:
     return json.loads(path.read_text())
 
 
-def validate_yaml_against_schema(yaml_path: Path, schema_path: Path) -> None:
-    data = _load_yaml(yaml_path)
+@functools.lru_cache(maxsize=32)
+def _compile_schema(schema_path: Path, mtime_ns: int) -> Any:
+    """Load, check and build a validator for ``schema_path``.
+
+    ``mtime_ns`` is only part of the cache key so edits to the schema are seen.
+    """
     schema = _load_json(schema_path)
-    jsonschema_validate(instance=data, schema=schema)
+    cls = jsonschema_validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def validate_against_schema(data: Any, schema_path: Path) -> None:
+    """Validate already-loaded ``data`` against the JSON schema at ``schema_path``."""
+    validator = _compile_schema(schema_path, schema_path.stat().st_mtime_ns)
+    # Same error selection as jsonschema.validate().
+    error = jsonschema_exceptions.best_match(validator.iter_errors(data))
+    if error is not None:
+        raise error
+
+
+def validate_yaml_against_schema(yaml_path: Path, schema_path: Path) -> None:
+    validate_against_schema(load_yaml(yaml_path), schema_path)
@@ -0,0 +1,16 @@
+"""YAML file loading shared by the engine, emitters and utilities."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import yaml  # type: ignore[import]
+
+# libyaml's loader is ~10x faster on the registry and loads the same data as SafeLoader.
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(path: Path) -> Any:
+    """Load ``path`` like ``yaml.safe_load``, using libyaml when it is built."""
+    return yaml.load(path.read_text(encoding="utf-8"), Loader=_LOADER)  # noqa: S506 - (C)SafeLoader